@@ -13,6 +13,7 @@ from PyQt6.QtGui import QIcon, QPalette, QColor
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 from src.config import APP_TITLE, APP_VERSION, ICON_FILE
+from src.styles import APP_QSS
 from src.services.database import get_db
 from src.services.auth import get_auth
 from src.services.logger import get_logger_service, get_logger, log_audit
@@ -94,6 +95,20 @@ def init_database():
             )
         """)
         
+        # Indexes for Edit tab filters (status / final_res, newest first)
+        # and the Input tab date range. Unfiltered "ORDER BY id DESC"
+        # already uses the clustered primary key.
+        for name, columns in [
+            ("idx_requests_status_res_id", "status, final_res, id DESC"),
+            ("idx_requests_final_res_id", "final_res, id DESC"),
+            ("idx_requests_date_id", "request_date, id DESC"),
+        ]:
+            cursor.execute(f"""
+                IF NOT EXISTS (SELECT * FROM sys.indexes
+                               WHERE name = '{name}' AND object_id = OBJECT_ID('requests'))
+                CREATE INDEX {name} ON requests ({columns})
+            """)
+
         # Create lookup tables
         for table in ["factory", "project", "phase", "category", "status"]:
             cursor.execute(f"""
@@ -151,6 +166,9 @@ def main():
     # Setup light palette to ensure proper text colors on dark-themed Windows
     setup_light_palette(app)
 
+    # Shared stylesheet (button variants) - parsed once for all widgets
+    app.setStyleSheet(APP_QSS)
+
     # Set application icon
     if os.path.exists(ICON_FILE):
         app.setWindowIcon(QIcon(ICON_FILE))
@@ -89,7 +89,8 @@ class CsvHandler:
             df.columns = [header_map.get(c, c) for c in df.columns]
             
             with self.db.get_cursor() as cursor:
-                for idx, row in df.iterrows():
+                # Plain dicts per row (keeps row.get by column name, no Series boxing)
+                for idx, row in enumerate(df.to_dict("records")):
                     try:
                         # Skip sample/empty rows
                         requester = str(row.get("requester", "")).strip()
@@ -2,8 +2,8 @@
 kRel - Request Controller
 Xử lý logic CRUD cho requests, tách khỏi UI
 """
+import functools
 import os
-import shutil
 from datetime import datetime
 from typing import Optional, List, Tuple
 
@@ -12,10 +12,18 @@ from PyQt6.QtCore import QDate
 from src.services.database import get_db
 from src.services.logger import get_logger, log_audit
 from src.services.data_event_bus import get_event_bus
+from src.utils.file_utils import fast_copy
 
 logger = get_logger("request_controller")
 
 
+@functools.lru_cache(maxsize=8)
+def _insert_sql(columns: tuple) -> str:
+    """INSERT statement for a column set (form always sends the same columns)"""
+    placeholders = ", ".join(["?"] * len(columns))
+    return f"INSERT INTO requests ({', '.join(columns)}) VALUES ({placeholders})"
+
+
 class RequestController:
     """Controller xử lý logic cho Request"""
     
@@ -45,26 +53,31 @@ class RequestController:
         
         return f"{date_str}-001"
     
-    def save(self, values: dict, user_name: str) -> Tuple[bool, str]:
+    def save(self, values: dict, user_name: str, conn=None) -> Tuple[bool, str]:
         """
         Lưu request mới
         
+        Args:
+            conn: Connection riêng của worker thread (None = connection chung)
+        
         Returns:
             Tuple[bool, str]: (success, message)
         """
         try:
             request_no = values.get("request_no", "")
             
-            # Build INSERT query
-            columns = list(values.keys())
-            placeholders = ", ".join(["?"] * len(columns))
-            cols_str = ", ".join(columns)
+            query = _insert_sql(tuple(values))
             
-            with self.db.get_cursor() as cursor:
-                cursor.execute(
-                    f"INSERT INTO requests ({cols_str}) VALUES ({placeholders})",
-                    list(values.values())
-                )
+            if conn is None:
+                with self.db.get_cursor() as cursor:
+                    cursor.execute(query, list(values.values()))
+            else:
+                try:
+                    conn.cursor().execute(query, list(values.values()))
+                    conn.commit()
+                except Exception:
+                    conn.rollback()
+                    raise
             
             logger.info(f"Request saved: {request_no}")
             log_audit("REQUEST_CREATE", user=user_name, details=f"Code: {request_no}")
@@ -86,7 +99,7 @@ class RequestController:
         try:
             dest_dir = os.path.join(self.log_path, request_no)
             os.makedirs(dest_dir, exist_ok=True)
-            shutil.copy(source_path, dest_dir)
+            fast_copy(source_path, os.path.join(dest_dir, os.path.basename(source_path)))
             logger.debug(f"Log copied to {dest_dir}")
             return True
         except Exception as e:
@@ -95,41 +108,55 @@ class RequestController:
     
     def get_recent_requests(self, filter_type: int = 1, 
                             search_text: str = "", 
-                            search_field: int = 0) -> List[tuple]:
+                            search_field: int = 0,
+                            limit: int = None,
+                            before_id: int = None) -> List[tuple]:
         """
-        Lấy danh sách request gần đây
+        Lấy danh sách request gần đây (id là cột cuối của mỗi row)
         
         Args:
             filter_type: 0=Hôm nay, 1=7 ngày, 2=30 ngày, 3=Tất cả
             search_text: Từ khóa tìm kiếm
             search_field: 0=Tất cả, 1=Mã YC, 2=Người YC, ...
+            limit: Số row tối đa (một trang), None = tất cả
+            before_id: Chỉ lấy row có id nhỏ hơn (trang tiếp theo)
         """
         try:
             today = QDate.currentDate()
+            conditions, params = [], []
             
             # Build date condition
             if filter_type == 0:
-                date_str = today.toString("yyyy-MM-dd")
-                condition = "request_date LIKE ?"
-                params = [f"{date_str}%"]
+                # Half-open range [today, tomorrow) - also matches "yyyy-MM-dd HH:mm" values
+                conditions.append("request_date >= ? AND request_date < ?")
+                params += [today.toString("yyyy-MM-dd"),
+                           today.addDays(1).toString("yyyy-MM-dd")]
             elif filter_type == 1:
                 start = today.addDays(-7).toString("yyyy-MM-dd")
-                condition = "request_date >= ?"
-                params = [start]
+                conditions.append("request_date >= ?")
+                params.append(start)
             elif filter_type == 2:
                 start = today.addDays(-30).toString("yyyy-MM-dd")
-                condition = "request_date >= ?"
-                params = [start]
-            else:
-                condition = "1=1"
-                params = []
+                conditions.append("request_date >= ?")
+                params.append(start)
+            
+            # Keyset paging: rows are ordered by id DESC
+            if before_id is not None:
+                conditions.append("id < ?")
+                params.append(before_id)
+            
+            top = ""
+            if limit:
+                top = "TOP (?) "
+                params.insert(0, limit)
             
+            where = " WHERE " + " AND ".join(conditions) if conditions else ""
             query = f"""
-                SELECT request_no, request_date, requester, factory, project, phase,
+                SELECT {top}request_no, request_date, requester, factory, project, phase,
                        equip_no, equip_name, test_condition,
                        plan_start, plan_end, actual_start, actual_end,
-                       status, dri, final_res
-                FROM requests WHERE {condition} ORDER BY id DESC
+                       status, dri, final_res, id
+                FROM requests{where} ORDER BY id DESC
             """
             
             rows = self.db.fetch_all(query, tuple(params) if params else None)
@@ -224,6 +224,17 @@ class DatabaseService:
         """Alias for connect()"""
         return self.connect()
 
+    def open_connection(self) -> Any:
+        """
+        Open a new, unshared connection (caller must close it).
+        pyodbc connections must not be shared across threads - use this in workers.
+        """
+        if not pyodbc:
+            raise ImportError("pyodbc package required for SQL Server")
+        conn = pyodbc.connect(self._get_connection_string(), timeout=self.CONNECTION_TIMEOUT)
+        conn.timeout = self.QUERY_TIMEOUT
+        return conn
+
     def _close_connection(self):
         """Internal method to close connection without lock"""
         if self._connection:
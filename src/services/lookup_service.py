@@ -31,6 +31,11 @@ class CacheEntry:
         return time.time() - self.created_at > self.ttl
 
 
+def _equipment_key(control_no: Optional[str]) -> str:
+    """Index key for control_no - case-insensitive like the SQL Server collation"""
+    return (control_no or "").strip().casefold()
+
+
 class LookupService:
     """
     Service for managing lookup tables and equipment.
@@ -50,7 +55,7 @@ class LookupService:
     def __init__(self):
         self._cache: Dict[str, CacheEntry] = {}
         self._equipment_cache: Optional[CacheEntry] = None
-        self._equipment_map_cache: Dict[str, CacheEntry] = {}
+        self._equipment_index: Dict[str, Equipment] = {}  # _equipment_key(control_no) -> Equipment
 
     def _validate_table_name(self, table_name: str) -> bool:
         """Validate table name to prevent SQL injection"""
@@ -85,13 +90,13 @@ class LookupService:
         else:
             self._cache.clear()
             self._equipment_cache = None
-            self._equipment_map_cache.clear()
+            self._equipment_index = {}
             lookup_logger.debug("All caches invalidated")
 
     def invalidate_equipment_cache(self):
         """Invalidate equipment-related caches"""
         self._equipment_cache = None
-        self._equipment_map_cache.clear()
+        self._equipment_index = {}
         # Also clear equipment list cache
         if "equipment_list" in self._cache:
             del self._cache["equipment_list"]
@@ -200,36 +205,22 @@ class LookupService:
         )
         result = [Equipment.from_db_row(row) for row in rows]
 
-        # Cache result
+        # Cache result (list + control_no index built from the same query)
         self._equipment_cache = CacheEntry(result, self.CACHE_TTL)
+        self._equipment_index = {
+            key: e for e in result if (key := _equipment_key(e.control_no))
+        }
         lookup_logger.debug("Cached all equipment data")
 
         return result
 
     def get_equipment_by_id(self, control_no: str) -> Optional[Equipment]:
-        """Get equipment by control number (cached)"""
+        """Get equipment by control number (one query loads all, then dict lookup)"""
         if not control_no:
             return None
 
-        # Check individual cache
-        cache_key = f"equip_{control_no}"
-        if cache_key in self._equipment_map_cache:
-            entry = self._equipment_map_cache[cache_key]
-            if not entry.is_expired():
-                return entry.data
-
-        db = get_db()
-        row = db.fetch_one(
-            "SELECT factory, control_no, name, spec, r1, r2, r3, r4, r5, remark FROM equipment WHERE control_no = ?",
-            (control_no,)
-        )
-
-        result = Equipment.from_db_row(row) if row else None
-
-        # Cache result
-        self._equipment_map_cache[cache_key] = CacheEntry(result, self.CACHE_TTL)
-
-        return result
+        self.get_all_equipment()
+        return self._equipment_index.get(_equipment_key(control_no))
 
     def get_equipment_list(self) -> List[str]:
         """Get list of equipment control numbers (cached)"""
@@ -334,9 +325,13 @@ class LookupService:
 _lookup_service: Optional[LookupService] = None
 
 def get_lookup_service() -> LookupService:
-    """Get lookup service instance"""
+    """Get lookup service instance (caches follow DataEventBus changes)"""
     global _lookup_service
     if _lookup_service is None:
         _lookup_service = LookupService()
+        from src.services.data_event_bus import get_event_bus
+        bus = get_event_bus()
+        bus.lookup_changed.connect(_lookup_service.invalidate_cache)
+        bus.equipment_changed.connect(_lookup_service.invalidate_equipment_cache)
     return _lookup_service
 
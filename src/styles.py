@@ -8,6 +8,15 @@ Design System:
 - Border-radius: 4px (small), 6px (medium), 8px (large)
 - Colors: Primary (#1565C0), Success (#2E7D32), Warning (#EF6C00), Error (#C62828)
 """
+import re
+
+
+def _minify(qss: str) -> str:
+    """Strip comments and redundant whitespace from a QSS block (run once at import)"""
+    qss = re.sub(r"/\*.*?\*/", "", qss, flags=re.S)
+    qss = re.sub(r"\s+", " ", qss)
+    return re.sub(r"\s*([{}:;,])\s*", r"\1", qss).strip()
+
 
 # ========== DESIGN TOKENS ==========
 COLORS = {
@@ -32,6 +41,23 @@ COLORS = {
     "background_section": "#F0F4F8",
     "border": "#E0E0E0",
     "border_light": "#F0F0F0",
+    "primary_hover": "#90CAF9",
+    "primary_tint": "#F8FBFF",
+    "group_bg": "#F5F9FF",
+    "input_border": "#CFD8DC",
+    "input_bg": "#FAFAFA",
+    "readonly_bg": "#ECEFF1",
+    "text_label": "#424242",
+    "disabled_bg": "#F5F5F5",
+    "success_hover": "#A5D6A7",
+    "success_medium": "#388E3C",
+    "success_dark": "#1B5E20",
+    "warning_hover": "#FFCC80",
+    "warning_text": "#E65100",
+    "error_hover": "#EF9A9A",
+    "orange": "#FF9800",
+    "orange_hover": "#FB8C00",
+    "orange_pressed": "#F57C00",
 }
 
 SPACING = {"xs": 4, "sm": 8, "md": 12, "lg": 16, "xl": 24, "xxl": 32}
@@ -40,182 +66,138 @@ RADIUS = {"sm": 4, "md": 6, "lg": 8}
 
 
 # ========== BUTTON STYLES ==========
-BTN_STYLE_BLUE = """
-    QPushButton {
-        background-color: #E3F2FD;
-        color: #1565C0;
-        border: 1px solid #BBDEFB;
-        border-radius: 6px;
-        padding: 8px 16px;
-        font-size: 13px;
+def _btn_outline(fg: str, bg: str, border: str, accent: str) -> str:
+    """Light button: hover fills with border color, pressed with accent"""
+    return f"""
+    QPushButton {{
+        background-color: {bg};
+        color: {fg};
+        border: 1px solid {border};
+        border-radius: {RADIUS['md']}px;
+        padding: {SPACING['sm']}px {SPACING['lg']}px;
+        font-size: {FONT_SIZES['sm']}px;
         font-weight: 600;
-    }
-    QPushButton:hover {
-        background-color: #BBDEFB;
-        border-color: #90CAF9;
-    }
-    QPushButton:pressed {
-        background-color: #90CAF9;
-    }
-    QPushButton:disabled {
-        background-color: #F5F5F5;
-        color: #BDBDBD;
-        border-color: #E0E0E0;
-    }
+    }}
+    QPushButton:hover {{
+        background-color: {border};
+        border-color: {accent};
+    }}
+    QPushButton:pressed {{
+        background-color: {accent};
+    }}
 """
 
-BTN_STYLE_RED = """
-    QPushButton {
-        background-color: #FFEBEE;
-        color: #C62828;
-        border: 1px solid #FFCDD2;
-        border-radius: 6px;
-        padding: 8px 16px;
-        font-size: 13px;
-        font-weight: 600;
-    }
-    QPushButton:hover {
-        background-color: #FFCDD2;
-        border-color: #EF9A9A;
-    }
-    QPushButton:pressed {
-        background-color: #EF9A9A;
-    }
-"""
-
-BTN_STYLE_GREEN = """
-    QPushButton {
-        background-color: #E8F5E9;
-        color: #2E7D32;
-        border: 1px solid #C8E6C9;
-        border-radius: 6px;
-        padding: 8px 16px;
-        font-size: 13px;
-        font-weight: 600;
-    }
-    QPushButton:hover {
-        background-color: #C8E6C9;
-        border-color: #A5D6A7;
-    }
-    QPushButton:pressed {
-        background-color: #A5D6A7;
-    }
-"""
 
-BTN_STYLE_GREEN_SOLID = """
-    QPushButton {
-        background-color: #2E7D32;
+def _btn_solid(bg: str, hover: str, pressed: str, padding: str) -> str:
+    """Solid button with white text"""
+    return f"""
+    QPushButton {{
+        background-color: {bg};
         color: white;
         border: none;
-        border-radius: 6px;
-        padding: 10px 20px;
-        font-size: 13px;
+        border-radius: {RADIUS['md']}px;
+        padding: {padding};
+        font-size: {FONT_SIZES['sm']}px;
         font-weight: bold;
-    }
-    QPushButton:hover {
-        background-color: #388E3C;
-    }
-    QPushButton:pressed {
-        background-color: #1B5E20;
-    }
+    }}
+    QPushButton:hover {{
+        background-color: {hover};
+    }}
+    QPushButton:pressed {{
+        background-color: {pressed};
+    }}
 """
 
-BTN_STYLE_ORANGE = """
-    QPushButton {
-        background-color: #FFF3E0;
-        color: #E65100;
-        border: 1px solid #FFE0B2;
-        border-radius: 6px;
-        padding: 8px 16px;
-        font-size: 13px;
-        font-weight: 600;
-    }
-    QPushButton:hover {
-        background-color: #FFE0B2;
-        border-color: #FFCC80;
-    }
-    QPushButton:pressed {
-        background-color: #FFCC80;
-    }
-"""
 
-BTN_STYLE_ORANGE_SOLID = """
-    QPushButton {
-        background-color: #FF9800;
-        color: white;
-        border: none;
-        border-radius: 6px;
-        padding: 8px 16px;
-        font-size: 13px;
-        font-weight: bold;
-    }
-    QPushButton:hover {
-        background-color: #FB8C00;
-    }
-    QPushButton:pressed {
-        background-color: #F57C00;
-    }
-"""
+BTN_STYLE_BLUE = _minify(_btn_outline(
+    COLORS["primary"], COLORS["primary_light"], COLORS["primary_border"], COLORS["primary_hover"]
+) + f"""
+    QPushButton:disabled {{
+        background-color: {COLORS['disabled_bg']};
+        color: {COLORS['text_disabled']};
+        border-color: {COLORS['border']};
+    }}
+""")
+
+BTN_STYLE_RED = _minify(_btn_outline(
+    COLORS["error"], COLORS["error_light"], COLORS["error_border"], COLORS["error_hover"]
+))
+
+BTN_STYLE_GREEN = _minify(_btn_outline(
+    COLORS["success"], COLORS["success_light"], COLORS["success_border"], COLORS["success_hover"]
+))
+
+BTN_STYLE_GREEN_SOLID = _minify(_btn_solid(
+    COLORS["success"], COLORS["success_medium"], COLORS["success_dark"], "10px 20px"
+))
+
+BTN_STYLE_ORANGE = _minify(_btn_outline(
+    COLORS["warning_text"], COLORS["warning_light"], COLORS["warning_border"], COLORS["warning_hover"]
+))
+
+BTN_STYLE_ORANGE_SOLID = _minify(_btn_solid(
+    COLORS["orange"], COLORS["orange_hover"], COLORS["orange_pressed"], "8px 16px"
+))
 
 # ========== LOGIN DIALOG STYLE ==========
-LOGIN_STYLE = """
-    QDialog {
-        background-color: #FFFFFF;
-    }
-    QLabel#Header {
-        color: #1565C0;
+LOGIN_STYLE = _minify(f"""
+    QDialog {{
+        background-color: {COLORS['background']};
+    }}
+    QLabel#Header {{
+        color: {COLORS['primary']};
         font-weight: 900;
         font-size: 24px;
         margin-bottom: 16px;
         padding: 0;
-    }
-    QLineEdit {
-        border: 1px solid #CFD8DC;
+    }}
+    QLineEdit {{
+        border: 1px solid {COLORS['input_border']};
         border-radius: 6px;
         padding: 10px 14px;
         font-size: 14px;
-        color: #212121;
-        background-color: #FAFAFA;
+        color: {COLORS['text_primary']};
+        background-color: {COLORS['input_bg']};
         margin: 0;
-    }
-    QLineEdit:focus {
-        border: 2px solid #1565C0;
-        background-color: #FFFFFF;
-    }
-    QCheckBox {
-        color: #212121;
+    }}
+    QLineEdit:focus {{
+        border: 2px solid {COLORS['primary']};
+        background-color: {COLORS['background']};
+    }}
+    QCheckBox {{
+        color: {COLORS['text_primary']};
         font-size: 13px;
         spacing: 8px;
-    }
-    QCheckBox::indicator {
+    }}
+    QCheckBox::indicator {{
         width: 18px;
         height: 18px;
-    }
-    QPushButton#LinkBtn {
+    }}
+    QPushButton#LinkBtn {{
         border: none;
         background: transparent;
-        color: #1565C0;
+        color: {COLORS['primary']};
         text-align: left;
         font-size: 13px;
         padding: 4px;
         font-weight: 500;
-    }
-    QPushButton#LinkBtn:hover {
+    }}
+    QPushButton#LinkBtn:hover {{
         color: #0D47A1;
         text-decoration: underline;
-    }
-"""
+    }}
+""")
 
 # ========== TAB WIDGET STYLE ==========
-TAB_STYLE = """
-    QTabWidget::pane {
-        border: 1px solid #E0E0E0;
+TAB_STYLE = _minify(f"""
+    QTabWidget::pane {{
+        border: 1px solid {COLORS['border']};
         background: white;
         border-radius: 8px;
         top: -1px;
-    }
-    QTabBar::tab {
-        background: #F5F5F5;
+    }}
+    QTabBar::tab {{
+        background: {COLORS['disabled_bg']};
         color: #666;
         padding: 12px 32px;
         margin-right: 4px;
@@ -223,375 +205,408 @@ TAB_STYLE = """
         border-top-right-radius: 8px;
         font-size: 13px;
         font-weight: 600;
-        border: 1px solid #E0E0E0;
+        border: 1px solid {COLORS['border']};
         border-bottom: none;
         min-width: 100px;
-    }
-    QTabBar::tab:selected {
-        background: #FFFFFF;
-        color: #1565C0;
-        border-top: 3px solid #1565C0;
-        border-bottom: 1px solid #FFFFFF;
+    }}
+    QTabBar::tab:selected {{
+        background: {COLORS['background']};
+        color: {COLORS['primary']};
+        border-top: 3px solid {COLORS['primary']};
+        border-bottom: 1px solid {COLORS['background']};
         padding-top: 10px;
-    }
-    QTabBar::tab:hover:!selected {
-        background: #E3F2FD;
-        color: #1565C0;
-    }
-"""
+    }}
+    QTabBar::tab:hover:!selected {{
+        background: {COLORS['primary_light']};
+        color: {COLORS['primary']};
+    }}
+""")
 
 # ========== TOOLBAR STYLE ==========
-TOOLBAR_STYLE = """
-    QToolBar {
-        background: qlineargradient(x1:0, y1:0, x2:0, y2:1, stop:0 #FFFFFF, stop:1 #F0F4F8);
-        border-bottom: 2px solid #BBDEFB;
+TOOLBAR_STYLE = _minify(f"""
+    QToolBar {{
+        background: qlineargradient(x1:0, y1:0, x2:0, y2:1, stop:0 {COLORS['background']}, stop:1 {COLORS['background_section']});
+        border-bottom: 2px solid {COLORS['primary_border']};
         padding: 8px 16px;
         spacing: 12px;
-    }
-"""
+    }}
+""")
 
-TOOLBAR_FRAME_STYLE = """
-    QFrame {
-        background-color: #F0F7FF;
-        border: 1px solid #BBDEFB;
+TOOLBAR_FRAME_STYLE = _minify(f"""
+    QFrame {{
+        background-color: {COLORS['primary_bg']};
+        border: 1px solid {COLORS['primary_border']};
         border-radius: 8px;
-    }
-"""
+    }}
+""")
 
 # ========== TABLE STYLE ==========
-TABLE_STYLE = """
-    QTableView {
-        border: 1px solid #BBDEFB;
+TABLE_STYLE = _minify(f"""
+    QTableView {{
+        border: 1px solid {COLORS['primary_border']};
         border-radius: 8px;
-        gridline-color: #E3F2FD;
+        gridline-color: {COLORS['primary_light']};
         background-color: white;
-        alternate-background-color: #F8FBFF;
-        selection-background-color: #BBDEFB;
-        selection-color: #1565C0;
+        alternate-background-color: {COLORS['primary_tint']};
+        selection-background-color: {COLORS['primary_border']};
+        selection-color: {COLORS['primary']};
         font-size: 13px;
-        color: #212121;
-    }
-    QTableView::item {
+        color: {COLORS['text_primary']};
+    }}
+    QTableView::item {{
         padding: 8px 12px;
-        border-bottom: 1px solid #E3F2FD;
-        color: #212121;
-    }
-    QTableView::item:selected {
-        background-color: #BBDEFB;
-        color: #1565C0;
-    }
-    QTableView::item:hover {
-        background-color: #E3F2FD;
-    }
-    QHeaderView::section {
+        border-bottom: 1px solid {COLORS['primary_light']};
+        color: {COLORS['text_primary']};
+    }}
+    QTableView::item:selected {{
+        background-color: {COLORS['primary_border']};
+        color: {COLORS['primary']};
+    }}
+    QTableView::item:hover {{
+        background-color: {COLORS['primary_light']};
+    }}
+    QHeaderView::section {{
         background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-            stop:0 #E3F2FD, stop:0.5 #BBDEFB, stop:1 #E3F2FD);
-        color: #1565C0;
+            stop:0 {COLORS['primary_light']}, stop:0.5 {COLORS['primary_border']}, stop:1 {COLORS['primary_light']});
+        color: {COLORS['primary']};
         padding: 10px 12px;
         border: none;
-        border-right: 1px solid #90CAF9;
-        border-bottom: 2px solid #1565C0;
+        border-right: 1px solid {COLORS['primary_hover']};
+        border-bottom: 2px solid {COLORS['primary']};
         font-weight: 600;
         font-size: 13px;
-    }
-    QHeaderView::section:hover {
+    }}
+    QHeaderView::section:hover {{
         background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-            stop:0 #BBDEFB, stop:0.5 #90CAF9, stop:1 #BBDEFB);
-    }
-    QTableView QTableCornerButton::section {
-        background: #E3F2FD;
+            stop:0 {COLORS['primary_border']}, stop:0.5 {COLORS['primary_hover']}, stop:1 {COLORS['primary_border']});
+    }}
+    QTableView QTableCornerButton::section {{
+        background: {COLORS['primary_light']};
         border: none;
-        border-bottom: 2px solid #1565C0;
-    }
-"""
+        border-bottom: 2px solid {COLORS['primary']};
+    }}
+""")
 
 # ========== GROUPBOX STYLE ==========
-GROUPBOX_STYLE = """
-    QGroupBox {
+GROUPBOX_STYLE = _minify(f"""
+    QGroupBox {{
         font-weight: 600;
         font-size: 14px;
-        color: #1565C0;
-       border: 1px solid #BBDEFB;
+        color: {COLORS['primary']};
+       border: 1px solid {COLORS['primary_border']};
         border-radius: 8px;
         margin-top: 16px;
         padding: 16px 12px 12px 12px;
-       background-color: #F5F9FF;
-    }
-    QGroupBox::title {
+       background-color: {COLORS['group_bg']};
+    }}
+    QGroupBox::title {{
         subcontrol-origin: margin;
         subcontrol-position: top left;
         left: 12px;
         padding: 0 8px;
-       background-color: #F5F9FF;
-    }
-"""
+       background-color: {COLORS['group_bg']};
+    }}
+""")
 
-GROUPBOX_BLUE_STYLE = """
-    QGroupBox {
-        font-weight: 600; font-size: 12px; color: #1565C0;
-        border: 1px solid #BBDEFB; border-radius: 6px;
+GROUPBOX_BLUE_STYLE = _minify(f"""
+    QGroupBox {{
+        font-weight: 600; font-size: 12px; color: {COLORS['primary']};
+        border: 1px solid {COLORS['primary_border']}; border-radius: 6px;
         margin-top: 12px; padding: 8px 8px 6px 8px;
         background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-            stop:0 #F8FBFF, stop:1 #F0F7FF);
-    }
-    QGroupBox::title {
+            stop:0 {COLORS['primary_tint']}, stop:1 {COLORS['primary_bg']});
+    }}
+    QGroupBox::title {{
         subcontrol-origin: margin; left: 12px; padding: 0 6px;
-        background-color: #E3F2FD; border-radius: 3px;
-    }
-"""
+        background-color: {COLORS['primary_light']}; border-radius: 3px;
+    }}
+""")
 
-TOOLBAR_BLUE_STYLE = """
-    QFrame {
+TOOLBAR_BLUE_STYLE = _minify(f"""
+    QFrame {{
         background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-            stop:0 #FFFFFF, stop:0.5 #F8FBFF, stop:1 #F0F7FF);
-        border: 1px solid #BBDEFB;
+            stop:0 {COLORS['background']}, stop:0.5 {COLORS['primary_tint']}, stop:1 {COLORS['primary_bg']});
+        border: 1px solid {COLORS['primary_border']};
         border-radius: 8px;
         margin: 2px 0;
-    }
-"""
+    }}
+""")
 
-FILTER_BLUE_STYLE = """
-    QFrame {
+FILTER_BLUE_STYLE = _minify(f"""
+    QFrame {{
         background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-            stop:0 #F8FBFF, stop:1 #E3F2FD);
-        border: 1px solid #BBDEFB;
+            stop:0 {COLORS['primary_tint']}, stop:1 {COLORS['primary_light']});
+        border: 1px solid {COLORS['primary_border']};
         border-radius: 8px;
-    }
-"""
+    }}
+""")
 
 # ========== CARD STYLE ==========
-CARD_STYLE = """
-    QFrame#Card {
-        background-color: #FFFFFF;
-        border: 1px solid #E0E0E0;
+CARD_STYLE = _minify(f"""
+    QFrame#Card {{
+        background-color: {COLORS['background']};
+        border: 1px solid {COLORS['border']};
         border-radius: 8px;
         padding: 16px;
-    }
-    QFrame#Card:hover {
-        border-color: #BBDEFB;
+    }}
+    QFrame#Card:hover {{
+        border-color: {COLORS['primary_border']};
         box-shadow: 0 2px 8px rgba(0,0,0,0.1);
-    }
-"""
+    }}
+""")
 
 # ========== INPUT FORM STYLE ==========
-INPUT_FORM_STYLE = """
-    QLabel {
+INPUT_FORM_STYLE = _minify(f"""
+    QLabel {{
         font-size: 13px;
-        color: #424242;
+        color: {COLORS['text_label']};
         font-weight: 500;
-    }
-    QLineEdit, QComboBox, QDateTimeEdit, QDateEdit {
-        border: 1px solid #CFD8DC;
+    }}
+    QLineEdit, QComboBox, QDateTimeEdit, QDateEdit {{
+        border: 1px solid {COLORS['input_border']};
         border-radius: 6px;
         padding: 8px 12px;
-        background-color: #FAFAFA;
+        background-color: {COLORS['input_bg']};
         min-height: 36px;
         font-size: 13px;
-        color: #212121;
-    }
-    QLineEdit:hover, QComboBox:hover, QDateTimeEdit:hover, QDateEdit:hover {
-        border-color: #90CAF9;
-        background-color: #FFFFFF;
-    }
-    QLineEdit:focus, QComboBox:focus, QDateTimeEdit:focus, QDateEdit:focus {
-        border: 2px solid #1565C0;
-        background-color: #FFFFFF;
-    }
-    QLineEdit:read-only {
-        background-color: #ECEFF1;
+        color: {COLORS['text_primary']};
+    }}
+    QLineEdit:hover, QComboBox:hover, QDateTimeEdit:hover, QDateEdit:hover {{
+        border-color: {COLORS['primary_hover']};
+        background-color: {COLORS['background']};
+    }}
+    QLineEdit:focus, QComboBox:focus, QDateTimeEdit:focus, QDateEdit:focus {{
+        border: 2px solid {COLORS['primary']};
+        background-color: {COLORS['background']};
+    }}
+    QLineEdit:read-only {{
+        background-color: {COLORS['readonly_bg']};
         color: #607D8B;
-        border-color: #CFD8DC;
-    }
-    QLineEdit::placeholder {
+        border-color: {COLORS['input_border']};
+    }}
+    QLineEdit::placeholder {{
         color: #9E9E9E;
-    }
-    QComboBox::drop-down {
+    }}
+    QComboBox::drop-down {{
         border: none;
         width: 30px;
-    }
-    QComboBox::down-arrow {
+    }}
+    QComboBox::down-arrow {{
         width: 12px;
         height: 12px;
-    }
-    QComboBox QAbstractItemView {
-        background-color: #FFFFFF;
-        color: #212121;
-        selection-background-color: #E3F2FD;
-        selection-color: #1565C0;
-        border: 1px solid #BBDEFB;
+    }}
+    QComboBox QAbstractItemView {{
+        background-color: {COLORS['background']};
+        color: {COLORS['text_primary']};
+        selection-background-color: {COLORS['primary_light']};
+        selection-color: {COLORS['primary']};
+        border: 1px solid {COLORS['primary_border']};
         border-radius: 4px;
         padding: 4px;
-    }
-    QComboBox QAbstractItemView::item {
+    }}
+    QComboBox QAbstractItemView::item {{
         padding: 8px 12px;
         min-height: 32px;
-    }
-    QComboBox QAbstractItemView::item:hover {
-        background-color: #F0F7FF;
-        color: #1565C0;
-    }
-    QTextEdit {
-        border: 1px solid #CFD8DC;
+    }}
+    QComboBox QAbstractItemView::item:hover {{
+        background-color: {COLORS['primary_bg']};
+        color: {COLORS['primary']};
+    }}
+    QTextEdit {{
+        border: 1px solid {COLORS['input_border']};
         border-radius: 6px;
         padding: 8px;
-        background-color: #FAFAFA;
+        background-color: {COLORS['input_bg']};
         font-size: 13px;
-    }
-    QTextEdit:focus {
-        border: 2px solid #1565C0;
-        background-color: #FFFFFF;
-    }
-"""
+    }}
+    QTextEdit:focus {{
+        border: 2px solid {COLORS['primary']};
+        background-color: {COLORS['background']};
+    }}
+""")
 
 # ========== INPUT TAB COMPACT STYLE ==========
-INPUT_TAB_STYLE = """
-    QGroupBox {
+INPUT_TAB_STYLE = _minify(f"""
+    QGroupBox {{
         font-weight: 600;
         font-size: 12px;
-        color: #1565C0;
-        border: 1px solid #BBDEFB;
+        color: {COLORS['primary']};
+        border: 1px solid {COLORS['primary_border']};
         border-radius: 6px;
         margin-top: 8px;
         padding: 8px 6px 6px 6px;
-        background-color: #F5F9FF;
-    }
-    QGroupBox::title {
+        background-color: {COLORS['group_bg']};
+    }}
+    QGroupBox::title {{
         subcontrol-origin: margin;
         left: 10px;
         padding: 0 4px;
-        background-color: #F5F9FF;
-    }
-    QLabel {
+        background-color: {COLORS['group_bg']};
+    }}
+    QLabel {{
         font-size: 11px;
-        color: #424242;
-    }
-    QLineEdit, QComboBox, QDateTimeEdit {
+        color: {COLORS['text_label']};
+    }}
+    QLineEdit, QComboBox, QDateTimeEdit {{
         font-size: 11px;
         padding: 4px 6px;
         min-height: 22px;
         max-height: 24px;
-        border: 1px solid #CFD8DC;
+        border: 1px solid {COLORS['input_border']};
         border-radius: 4px;
-        background-color: #FFFFFF;
-        color: #212121;
-    }
-    QComboBox QAbstractItemView {
-        background-color: #FFFFFF;
-        color: #212121;
-        selection-background-color: #E3F2FD;
-        selection-color: #1565C0;
-        border: 1px solid #CFD8DC;
-    }
-    QComboBox QAbstractItemView::item {
+        background-color: {COLORS['background']};
+        color: {COLORS['text_primary']};
+    }}
+    QComboBox QAbstractItemView {{
+        background-color: {COLORS['background']};
+        color: {COLORS['text_primary']};
+        selection-background-color: {COLORS['primary_light']};
+        selection-color: {COLORS['primary']};
+        border: 1px solid {COLORS['input_border']};
+    }}
+    QComboBox QAbstractItemView::item {{
         padding: 4px 8px;
         min-height: 20px;
-    }
-    QLineEdit:hover, QComboBox:hover, QDateTimeEdit:hover {
-        border-color: #90CAF9;
+    }}
+    QLineEdit:hover, QComboBox:hover, QDateTimeEdit:hover {{
+        border-color: {COLORS['primary_hover']};
         background-color: #FAFEFF;
-    }
-    QLineEdit:focus, QComboBox:focus, QDateTimeEdit:focus {
-        border: 1.5px solid #1565C0;
-    }
-    QLineEdit:read-only {
-        background-color: #ECEFF1;
+    }}
+    QLineEdit:focus, QComboBox:focus, QDateTimeEdit:focus {{
+        border: 1.5px solid {COLORS['primary']};
+    }}
+    QLineEdit:read-only {{
+        background-color: {COLORS['readonly_bg']};
         color: #757575;
-    }
-"""
+    }}
+""")
 
 # ========== SETTINGS MENU STYLE ==========
-SETTINGS_MENU_STYLE = """
-    QListWidget {
+SETTINGS_MENU_STYLE = _minify(f"""
+    QListWidget {{
         border: none;
-        border-right: 2px solid #BBDEFB;
-        background: qlineargradient(x1:0, y1:0, x2:1, y2:0, stop:0 #F0F7FF, stop:1 #F8FAFC);
+        border-right: 2px solid {COLORS['primary_border']};
+        background: qlineargradient(x1:0, y1:0, x2:1, y2:0, stop:0 {COLORS['primary_bg']}, stop:1 #F8FAFC);
         font-size: 14px;
         outline: none;
-    }
-    QListWidget::item {
+    }}
+    QListWidget::item {{
         padding: 18px 20px;
-        border-bottom: 1px solid #E3F2FD;
-        color: #424242;
+        border-bottom: 1px solid {COLORS['primary_light']};
+        color: {COLORS['text_label']};
         margin-bottom: 2px;
-    }
-    QListWidget::item:selected {
-        background: qlineargradient(x1:0, y1:0, x2:1, y2:0, stop:0 #BBDEFB, stop:1 #E3F2FD);
-        color: #1565C0;
+    }}
+    QListWidget::item:selected {{
+        background: qlineargradient(x1:0, y1:0, x2:1, y2:0, stop:0 {COLORS['primary_border']}, stop:1 {COLORS['primary_light']});
+        color: {COLORS['primary']};
         font-weight: 700;
-        border-left: 4px solid #1565C0;
+        border-left: 4px solid {COLORS['primary']};
         padding-left: 16px;
-    }
-    QListWidget::item:hover:!selected {
-        background: #E3F2FD;
+    }}
+    QListWidget::item:hover:!selected {{
+        background: {COLORS['primary_light']};
         color: #1976D2;
-    }
-"""
+    }}
+""")
 
 # ========== FILTER FRAME STYLE ==========
-FILTER_FRAME_STYLE = """
-    QFrame {
-        background-color: #F0F7FF;
-        border: 1px solid #BBDEFB;
+FILTER_FRAME_STYLE = _minify(f"""
+    QFrame {{
+        background-color: {COLORS['primary_bg']};
+        border: 1px solid {COLORS['primary_border']};
         border-radius: 8px;
-    }
-    QLabel {
+    }}
+    QLabel {{
         font-size: 13px;
-        color: #424242;
+        color: {COLORS['text_label']};
         font-weight: 500;
-    }
-    QComboBox, QDateEdit {
-        border: 1px solid #CFD8DC;
+    }}
+    QComboBox, QDateEdit {{
+        border: 1px solid {COLORS['input_border']};
         border-radius: 6px;
         padding: 6px 10px;
-        background-color: #FFFFFF;
+        background-color: {COLORS['background']};
         min-height: 32px;
         font-size: 13px;
-    }
-    QComboBox:hover, QDateEdit:hover {
-        border-color: #90CAF9;
-    }
-    QComboBox:focus, QDateEdit:focus {
-        border: 2px solid #1565C0;
-    }
-    QComboBox QAbstractItemView {
-        background-color: #FFFFFF;
-        color: #212121;
-        selection-background-color: #E3F2FD;
-        selection-color: #1565C0;
-        border: 1px solid #BBDEFB;
-    }
-    QComboBox QAbstractItemView::item {
+    }}
+    QComboBox:hover, QDateEdit:hover {{
+        border-color: {COLORS['primary_hover']};
+    }}
+    QComboBox:focus, QDateEdit:focus {{
+        border: 2px solid {COLORS['primary']};
+    }}
+    QComboBox QAbstractItemView {{
+        background-color: {COLORS['background']};
+        color: {COLORS['text_primary']};
+        selection-background-color: {COLORS['primary_light']};
+        selection-color: {COLORS['primary']};
+        border: 1px solid {COLORS['primary_border']};
+    }}
+    QComboBox QAbstractItemView::item {{
         padding: 6px 10px;
         min-height: 28px;
-    }
-    QComboBox QAbstractItemView::item:hover {
-        background-color: #F0F7FF;
-    }
-"""
+    }}
+    QComboBox QAbstractItemView::item:hover {{
+        background-color: {COLORS['primary_bg']};
+    }}
+""")
 
 # ========== INFO LABEL STYLE ==========
-INFO_LABEL_STYLE = """
-    QLabel {
+INFO_LABEL_STYLE = _minify(f"""
+    QLabel {{
         font-size: 13px;
-        color: #1565C0;
+        color: {COLORS['primary']};
         padding: 8px 12px;
         font-weight: 600;
-        background: #E3F2FD;
-        border: 1px solid #BBDEFB;
+        background: {COLORS['primary_light']};
+        border: 1px solid {COLORS['primary_border']};
         border-radius: 6px;
-    }
-"""
+    }}
+""")
 
 # ========== RESULT FIELD STYLE ==========
-RESULT_FIELD_STYLE = """
-    QLineEdit {
+RESULT_FIELD_STYLE = _minify(f"""
+    QLineEdit {{
         background-color: #FFFDE7;
         border: 1px solid #FFF59D;
         border-radius: 4px;
         font-weight: 500;
-    }
-    QLineEdit:focus {
+    }}
+    QLineEdit:focus {{
         border: 2px solid #FBC02D;
-    }
-"""
+    }}
+""")
+
+
+# ========== APPLICATION STYLE ==========
+# Button variants keyed by objectName - áp dụng một lần qua QApplication
+BUTTON_VARIANTS = {
+    "BtnBlue": BTN_STYLE_BLUE,
+    "BtnRed": BTN_STYLE_RED,
+    "BtnGreen": BTN_STYLE_GREEN,
+    "BtnGreenSolid": BTN_STYLE_GREEN_SOLID,
+    "BtnOrange": BTN_STYLE_ORANGE,
+    "BtnOrangeSolid": BTN_STYLE_ORANGE_SOLID,
+}
+
+
+def _scope_button(qss: str, object_name: str) -> str:
+    """Restrict a QPushButton style to buttons with the given objectName"""
+    return qss.replace("QPushButton", f"QPushButton#{object_name}")
+
+
+def style_button(btn, variant: str):
+    """
+    Apply a button variant from APP_QSS (Blue, Red, Green, GreenSolid, Orange, OrangeSolid).
+    Only sets the objectName - no per-widget stylesheet is parsed.
+    """
+    name = f"Btn{variant}"
+    if name not in BUTTON_VARIANTS:
+        raise ValueError(f"Unknown button variant: {variant}")
+    btn.setObjectName(name)
+
 
+# Single stylesheet parsed once by Qt: app.setStyleSheet(APP_QSS)
+APP_QSS = "\n".join(
+    _scope_button(qss, name) for name, qss in BUTTON_VARIANTS.items()
+)
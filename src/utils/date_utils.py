@@ -1,10 +1,13 @@
 """
 kRel - Date Utilities
 """
+import re
+import time
 from datetime import datetime, date
+from functools import lru_cache
 from typing import Optional, Union
 
-from PyQt6.QtCore import QDate, QDateTime
+from PyQt6.QtCore import QDate, QDateTime, QTime
 
 
 # Default formats
@@ -12,6 +15,21 @@ DATE_FORMAT = "%Y-%m-%d"
 DATETIME_FORMAT = "%Y-%m-%d %H:%M"
 DATE_FORMAT_DISPLAY = "%d/%m/%Y"
 
+# Accepted input formats, grouped by delimiter: (fast regex, strptime fallbacks)
+_TIME_PART = r"(?: (\d{1,2}):(\d{1,2})(?::(\d{1,2}))?)?"
+_ISO_PARSE = (
+    re.compile(r"(\d{4})-(\d{1,2})-(\d{1,2})" + _TIME_PART),
+    ("%Y-%m-%d %H:%M:%S", "%Y-%m-%d %H:%M", "%Y-%m-%d"),
+)
+_DMY_PARSE = (
+    re.compile(r"(\d{1,2})/(\d{1,2})/(\d{4})" + _TIME_PART),
+    ("%d/%m/%Y %H:%M:%S", "%d/%m/%Y %H:%M", "%d/%m/%Y"),
+)
+
+# Formats tried with Qt's own parser before falling back to parse_date
+_QT_DATE_FORMATS = ("yyyy-MM-dd", "dd/MM/yyyy")
+_QT_DATETIME_FORMATS = ("yyyy-MM-dd HH:mm:ss", "yyyy-MM-dd HH:mm")
+
 
 def to_string(dt: Union[datetime, date, QDate, QDateTime, None], 
               fmt: str = DATETIME_FORMAT) -> str:
@@ -34,32 +52,52 @@ def to_string(dt: Union[datetime, date, QDate, QDateTime, None],
     return str(dt)
 
 
+@lru_cache(maxsize=4096)
 def parse_date(date_str: str) -> Optional[datetime]:
-    """Parse date string to datetime"""
+    """Parse date string to datetime (cached - same strings repeat across rows)"""
     if not date_str:
         return None
-    
-    # Try common formats
-    formats = [
-        "%Y-%m-%d %H:%M:%S",
-        "%Y-%m-%d %H:%M",
-        "%Y-%m-%d",
-        "%d/%m/%Y %H:%M:%S",
-        "%d/%m/%Y %H:%M",
-        "%d/%m/%Y",
-    ]
-    
+
+    date_str = date_str.strip()
+
+    # Dispatch on the first delimiter: YYYY-... or DD/...
+    if date_str[4:5] == "-":
+        pattern, formats = _ISO_PARSE
+        iso = True
+    elif "/" in date_str[1:3]:
+        pattern, formats = _DMY_PARSE
+        iso = False
+    else:
+        return None
+
+    # Fast path: one regex match instead of several strptime attempts
+    m = pattern.fullmatch(date_str)
+    if m:
+        a, b, c, h, mi, sec = m.groups()
+        y, mo, d = (a, b, c) if iso else (c, b, a)
+        try:
+            return datetime(int(y), int(mo), int(d),
+                            int(h or 0), int(mi or 0), int(sec or 0))
+        except ValueError:
+            return None
+
     for fmt in formats:
         try:
-            return datetime.strptime(date_str.strip(), fmt)
+            return datetime.strptime(date_str, fmt)
         except ValueError:
             continue
-    
+
     return None
 
 
 def to_qdate(date_str: str) -> QDate:
     """Convert string to QDate"""
+    if date_str:
+        # Qt parses the common formats natively; Python only as fallback
+        for qt_fmt in _QT_DATE_FORMATS:
+            qd = QDate.fromString(date_str, qt_fmt)
+            if qd.isValid():
+                return qd
     dt = parse_date(date_str)
     if dt:
         return QDate(dt.year, dt.month, dt.day)
@@ -68,23 +106,44 @@ def to_qdate(date_str: str) -> QDate:
 
 def to_qdatetime(date_str: str) -> QDateTime:
     """Convert string to QDateTime"""
+    if date_str:
+        for qt_fmt in _QT_DATETIME_FORMATS:
+            qdt = QDateTime.fromString(date_str, qt_fmt)
+            if qdt.isValid():
+                return qdt
     dt = parse_date(date_str)
     if dt:
         return QDateTime(
             QDate(dt.year, dt.month, dt.day),
-            dt.time() if isinstance(dt, datetime) else None
+            QTime(dt.hour, dt.minute, dt.second)
         )
     return QDateTime.currentDateTime()
 
 
+# Formatted "now" strings for the current wall-clock second
+_NOW_CACHE: dict = {}
+
+
+def _formatted_now(fmt: str) -> str:
+    """Format current time, reusing the result within the same second"""
+    key = (int(time.time()), fmt)
+    value = _NOW_CACHE.get(key)
+    if value is None:
+        value = datetime.now().strftime(fmt)
+        if _NOW_CACHE and next(iter(_NOW_CACHE))[0] != key[0]:
+            _NOW_CACHE.clear()
+        _NOW_CACHE[key] = value
+    return value
+
+
 def today_string(fmt: str = DATE_FORMAT) -> str:
     """Get today's date as string"""
-    return datetime.now().strftime(fmt)
+    return _formatted_now(fmt)
 
 
 def now_string(fmt: str = DATETIME_FORMAT) -> str:
     """Get current datetime as string"""
-    return datetime.now().strftime(fmt)
+    return _formatted_now(fmt)
 
 
 def days_between(start_str: str, end_str: str) -> int:
@@ -97,6 +156,7 @@ def days_between(start_str: str, end_str: str) -> int:
     return 0
 
 
+@lru_cache(maxsize=4096)
 def format_for_display(date_str: str) -> str:
     """Format date string for display (DD/MM/YYYY)"""
     dt = parse_date(date_str)
@@ -3,8 +3,14 @@ kRel - File Utilities
 """
 import os
 import shutil
+import sys
 import csv
-from typing import List, Optional
+import codecs
+from typing import Iterator, List, Optional
+
+# Invalid filename characters -> "_" as a 256-byte lookup table (all ASCII,
+# so UTF-8 multibyte sequences are never touched)
+_SAFE_FILENAME_TABLE = bytes.maketrans(b'<>:"/\\|?*', b"_" * 9)
 
 
 def ensure_directory(path: str) -> bool:
@@ -16,6 +22,20 @@ def ensure_directory(path: str) -> bool:
         return False
 
 
+def fast_copy(src: str, dest_path: str) -> str:
+    """
+    Copy file contents only (no metadata), letting the OS do the transfer:
+    CopyFileExW on Windows, sendfile via shutil.copyfile elsewhere
+    """
+    if sys.platform == "win32":
+        import ctypes
+        kernel32 = ctypes.WinDLL("kernel32", use_last_error=True)
+        if not kernel32.CopyFileExW(src, dest_path, None, None, None, 0):
+            raise ctypes.WinError(ctypes.get_last_error())
+        return dest_path
+    return shutil.copyfile(src, dest_path)
+
+
 def copy_file(src: str, dest_dir: str, new_name: str = None) -> Optional[str]:
     """
     Copy file to destination directory
@@ -29,44 +49,45 @@ def copy_file(src: str, dest_dir: str, new_name: str = None) -> Optional[str]:
     filename = new_name if new_name else os.path.basename(src)
     dest_path = os.path.join(dest_dir, filename)
     
-    # Handle duplicate names
-    if os.path.exists(dest_path):
-        base, ext = os.path.splitext(filename)
-        counter = 1
-        while os.path.exists(dest_path):
-            dest_path = os.path.join(dest_dir, f"{base}_{counter}{ext}")
-            counter += 1
-    
     try:
-        shutil.copy2(src, dest_path)
+        # Handle duplicate names (one directory scan instead of a stat per candidate)
+        existing = {os.path.normcase(name) for name in os.listdir(dest_dir)}
+        if os.path.normcase(filename) in existing:
+            base, ext = os.path.splitext(filename)
+            counter = 1
+            while os.path.normcase(candidate := f"{base}_{counter}{ext}") in existing:
+                counter += 1
+            dest_path = os.path.join(dest_dir, candidate)
+        
+        fast_copy(src, dest_path)
         return dest_path
     except Exception:
         return None
 
 
+def iter_csv(filepath: str, encoding: str = "utf-8") -> Iterator[List[str]]:
+    """Stream CSV rows one at a time (UTF-8 BOM detected up front)"""
+    if not os.path.exists(filepath):
+        return
+
+    if encoding.lower().replace("_", "-") in ("utf-8", "utf8"):
+        with open(filepath, "rb") as f:
+            if f.read(len(codecs.BOM_UTF8)) == codecs.BOM_UTF8:
+                encoding = "utf-8-sig"
+
+    with open(filepath, "r", encoding=encoding, newline="") as f:
+        yield from csv.reader(f)
+
+
 def read_csv(filepath: str, encoding: str = "utf-8") -> List[List[str]]:
     """Read CSV file and return list of rows"""
-    if not os.path.exists(filepath):
-        return []
-    
     rows = []
     try:
-        with open(filepath, "r", encoding=encoding, newline="") as f:
-            reader = csv.reader(f)
-            for row in reader:
-                rows.append(row)
-    except UnicodeDecodeError:
-        # Try with different encoding
-        try:
-            with open(filepath, "r", encoding="utf-8-sig", newline="") as f:
-                reader = csv.reader(f)
-                for row in reader:
-                    rows.append(row)
-        except Exception:
-            pass
+        for row in iter_csv(filepath, encoding):
+            rows.append(row)
     except Exception:
         pass
-    
+
     return rows
 
 
@@ -100,10 +121,9 @@ def is_image_file(filepath: str) -> bool:
 
 def get_safe_filename(filename: str) -> str:
     """Remove invalid characters from filename"""
-    invalid_chars = '<>:"/\\|?*'
-    for char in invalid_chars:
-        filename = filename.replace(char, "_")
-    return filename
+    return filename.encode("utf-8", "surrogatepass").translate(
+        _SAFE_FILENAME_TABLE
+    ).decode("utf-8", "surrogatepass")
 
 
 def open_file_location(filepath: str) -> bool:
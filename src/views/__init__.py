@@ -1,14 +1,18 @@
 """
 kRel - Views Package
-UI Views and Dialogs
+UI Views and Dialogs (loaded lazily on first access)
 """
-from src.views.login_dialog import LoginDialog
-from src.views.register_dialog import RegisterDialog
-from src.views.main_window import MainWindow
-from src.views.input_tab import InputTab
-from src.views.edit_tab import EditTab
-from src.views.report_tab import ReportTab
-from src.views.settings_tab import SettingsTab
+import importlib
+
+_LAZY = {
+    "LoginDialog": "src.views.login_dialog",
+    "RegisterDialog": "src.views.register_dialog",
+    "MainWindow": "src.views.main_window",
+    "InputTab": "src.views.input_tab",
+    "EditTab": "src.views.edit_tab",
+    "ReportTab": "src.views.report_tab",
+    "SettingsTab": "src.views.settings_tab",
+}
 
 __all__ = [
     "LoginDialog",
@@ -18,4 +22,16 @@ __all__ = [
     "EditTab",
     "ReportTab",
     "SettingsTab",
-]
\ No newline at end of file
+]
+
+
+def __getattr__(name):
+    if name in _LAZY:
+        obj = getattr(importlib.import_module(_LAZY[name]), name)
+        globals()[name] = obj
+        return obj
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
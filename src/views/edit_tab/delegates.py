@@ -2,11 +2,14 @@
 kRel - Table Delegates
 Các delegate cho table editing (combo, date, recipe...)
 """
-from PyQt6.QtWidgets import QStyledItemDelegate, QComboBox, QDateTimeEdit, QStyle, QApplication
-from PyQt6.QtCore import Qt, QDateTime
-from PyQt6.QtGui import QBrush, QPainter, QColor
+from PyQt6.QtWidgets import (
+    QStyledItemDelegate, QComboBox, QDateTimeEdit, QStyle, QStyleOptionViewItem,
+    QApplication
+)
+from PyQt6.QtCore import Qt, QDateTime, QPointF, QRect
+from PyQt6.QtGui import QPainter, QStaticText
 
-from src.services.database import get_db
+from src.services.lookup_service import get_lookup_service
 
 
 class BackgroundPainterMixin:
@@ -14,15 +17,10 @@ class BackgroundPainterMixin:
 
     def paint(self, painter: QPainter, option, index):
         """Paint with correct background color from model"""
-        # Get background color from model
+        # Model returns shared QBrush objects; fillRect leaves painter state untouched
         bg = index.data(Qt.ItemDataRole.BackgroundRole)
         if bg is not None:
-            painter.save()
-            if isinstance(bg, QBrush):
-                painter.fillRect(option.rect, bg)
-            elif isinstance(bg, QColor):
-                painter.fillRect(option.rect, bg)
-            painter.restore()
+            painter.fillRect(option.rect, bg)
 
         # Call parent paint
         super().paint(painter, option, index)
@@ -35,6 +33,10 @@ class ComboDelegate(BackgroundPainterMixin, QStyledItemDelegate):
         super().__init__(parent)
         self.data_source = data_source
 
+    def set_data_source(self, data_source: dict):
+        """Replace combo lists {column: [values]}"""
+        self.data_source = data_source
+
     def createEditor(self, parent, option, index):
         if index.column() in self.data_source:
             combo = QComboBox(parent)
@@ -58,7 +60,79 @@ class ComboDelegate(BackgroundPainterMixin, QStyledItemDelegate):
             super().setModelData(editor, model, index)
 
 
-class DateDelegate(BackgroundPainterMixin, QStyledItemDelegate):
+class StaticTextDelegate(BackgroundPainterMixin, QStyledItemDelegate):
+    """Delegate that draws plain cells from cached QStaticText (no text layout per repaint)"""
+
+    MAX_CACHED = 4096
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._static = {}  # text -> prepared QStaticText
+
+    def clear_cache(self):
+        """Drop prepared texts (call after the model is reloaded)"""
+        self._static.clear()
+
+    def _static_text(self, text: str, font) -> QStaticText:
+        static = self._static.get(text)
+        if static is None:
+            if len(self._static) >= self.MAX_CACHED:
+                self._static.clear()
+            static = self._static[text] = QStaticText(text)
+            static.setTextFormat(Qt.TextFormat.PlainText)
+            static.prepare(font=font)
+        return static
+
+    @staticmethod
+    def _style(opt) -> QStyle:
+        return opt.widget.style() if opt.widget is not None else QApplication.style()
+
+    @classmethod
+    def text_rect(cls, opt) -> QRect:
+        """Where the style draws an item's text (QSS item padding included)"""
+        style, widget = cls._style(opt), opt.widget
+        rect = style.subElementRect(QStyle.SubElement.SE_ItemViewItemText, opt, widget)
+        # The style insets item text by the focus frame margin
+        margin = style.pixelMetric(QStyle.PixelMetric.PM_FocusFrameHMargin, None, widget) + 1
+        return rect.adjusted(margin, 0, -margin, 0)
+
+    def paint(self, painter: QPainter, option, index):
+        text = index.data(Qt.ItemDataRole.DisplayRole)
+        # Selected/hovered/focused cells and model text colors go through the style
+        styled = (QStyle.StateFlag.State_Selected | QStyle.StateFlag.State_MouseOver
+                  | QStyle.StateFlag.State_HasFocus)
+        if (not text or option.state & styled
+                or index.data(Qt.ItemDataRole.ForegroundRole) is not None):
+            super().paint(painter, option, index)
+            return
+
+        opt = QStyleOptionViewItem(option)
+        self.initStyleOption(opt, index)
+        rect = self.text_rect(opt)
+        static = self._static_text(text, opt.font)
+        # Text that does not fit needs the style's elision
+        if static.size().width() > rect.width():
+            super().paint(painter, option, index)
+            return
+
+        bg = index.data(Qt.ItemDataRole.BackgroundRole)
+        if bg is not None:
+            painter.fillRect(option.rect, bg)
+
+        # Item frame (QSS border-bottom) from the style, text from the cache
+        opt.text = ""
+        self._style(opt).drawControl(QStyle.ControlElement.CE_ItemViewItem, opt, painter, opt.widget)
+
+        painter.save()
+        painter.setClipRect(rect)
+        painter.setFont(opt.font)
+        painter.setPen(opt.palette.text().color())
+        y = rect.top() + (rect.height() - static.size().height()) / 2
+        painter.drawStaticText(QPointF(rect.left(), y), static)
+        painter.restore()
+
+
+class DateDelegate(StaticTextDelegate):
     """Delegate for date columns with proper background painting"""
 
     def createEditor(self, parent, option, index):
@@ -103,13 +177,8 @@ class RecipeDelegate(BackgroundPainterMixin, QStyledItemDelegate):
 
         if equip_no:
             try:
-                db = get_db()
-                rows = db.fetch_all(
-                    "SELECT r1, r2, r3, r4, r5 FROM equipment WHERE control_no=?",
-                    (str(equip_no),)
-                )
-                if rows:
-                    combo.addItems([str(x) for x in rows[0] if x and str(x).strip()])
+                # LookupService caches equipment and is invalidated via DataEventBus
+                combo.addItems(get_lookup_service().get_equipment_recipes(str(equip_no)))
             except Exception:
                 pass
 
@@ -120,9 +189,8 @@ class RecipeDelegate(BackgroundPainterMixin, QStyledItemDelegate):
             model.setData(index, editor.currentText(), Qt.ItemDataRole.EditRole)
 
 
-class NoEditDelegate(BackgroundPainterMixin, QStyledItemDelegate):
-    """Delegate that disables editing with proper background painting"""
+class NoEditDelegate(StaticTextDelegate):
+    """Read-only delegate - plain cells drawn from cached QStaticText"""
 
     def createEditor(self, parent, option, index):
         return None
-
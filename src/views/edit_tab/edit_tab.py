@@ -2,8 +2,8 @@
 kRel - Edit Tab (Refactored)
 Tab chỉnh sửa dữ liệu
 """
+import functools
 import os
-import shutil
 from configparser import ConfigParser
 
 from PyQt6.QtWidgets import (
@@ -11,23 +11,22 @@ from PyQt6.QtWidgets import (
     QPushButton, QComboBox, QHeaderView, QTableView,
     QFileDialog, QMessageBox
 )
-from PyQt6.QtCore import Qt
-from PyQt6.QtGui import QStandardItemModel, QStandardItem, QColor
-import pandas as pd
+from PyQt6.QtCore import Qt, QSignalBlocker, QThreadPool, QTimer
 
 from src.config import CONFIG_FILE, DEFAULT_LOG_PATH
 from src.services.database import get_db
+from src.services.lookup_service import get_lookup_service
 from src.services.logger import get_logger, log_audit
 from src.services.data_event_bus import get_event_bus
-from src.styles import (
-    BTN_STYLE_BLUE, BTN_STYLE_GREEN_SOLID, BTN_STYLE_ORANGE_SOLID, BTN_STYLE_RED,
-    TOOLBAR_BLUE_STYLE, FILTER_BLUE_STYLE
-)
+from src.utils.file_utils import fast_copy
+from src.styles import TOOLBAR_BLUE_STYLE, FILTER_BLUE_STYLE, style_button
 from src.widgets.loading_overlay import LoadingMixin
 
 from src.views.edit_tab.delegates import (
     ComboDelegate, DateDelegate, RecipeDelegate, NoEditDelegate
 )
+from src.views.edit_tab.requests_model import RequestsTableModel
+from src.views.edit_tab.load_worker import LoadRequestsWorker, ExportCsvWorker
 
 logger = get_logger("edit_tab")
 
@@ -45,6 +44,24 @@ DB_SELECT_COLS = [
 DEFAULT_COLOR = "#FFFFFF"
 
 
+@functools.lru_cache(maxsize=None)
+def _select_sql(conditions: tuple, paged: bool = False) -> str:
+    """SELECT statement for a set of WHERE conditions (built once per combination)
+
+    paged: prepend TOP (?) - the page size is then the first parameter
+    """
+    where = " WHERE " + " AND ".join(conditions) if conditions else ""
+    top = "TOP (?) " if paged else ""
+    return f"SELECT {top}{', '.join(DB_SELECT_COLS)} FROM requests{where} ORDER BY id DESC"
+
+
+# Save statement: every selected column except id, keyed by id (built once at import)
+_UPDATE_COLS = [c for c in DB_SELECT_COLS if c != "id"]
+_UPDATE_SQL = (
+    "UPDATE requests SET " + ", ".join(f"{c}=?" for c in _UPDATE_COLS) + " WHERE id=?"
+)
+
+
 class EditTab(QWidget, LoadingMixin):
     """Tab chỉnh sửa dữ liệu với CRUD support"""
 
@@ -59,6 +76,21 @@ class EditTab(QWidget, LoadingMixin):
 
     DATE_COLS = [3, 23, 24, 26, 27]
 
+    REQUEST_NO_COL = 2
+
+    # Column sizing: fixed widths for Trạng thái, ID, Mã YC, Ngày YC; others fitted from a sample
+    FIXED_COL_WIDTHS = [90, 50, 110, 95]
+    WIDTH_SAMPLE_ROWS = 50
+    MAX_COL_WIDTH = 320
+
+    RELOAD_DELAY_MS = 150
+
+    # Rows per page; further pages load as the table scrolls (keyset on id DESC)
+    PAGE_SIZE = 500
+
+    # Ids per DELETE ... IN (...) statement (SQL Server allows at most 2100 parameters)
+    DELETE_CHUNK = 1000
+
     HEADERS = [
         "Trạng thái", "ID", "Mã YC", "Ngày YC", "Người YC", "Nhà máy", "Dự án", "Giai đoạn",
         "Hạng mục", "Chi tiết", "SL",
@@ -73,9 +105,34 @@ class EditTab(QWidget, LoadingMixin):
         super().__init__(parent)
         self.db = get_db()
         self.table = None
-        self.model = None
+        self.model = RequestsTableModel(
+            self.HEADERS, status_col=0, result_cols=self.RESULT_COLS,
+            readonly_cols=[1],
+            # Auto-fill equipment name (equip_no is col 20, equip_name is col 21)
+            autofill={20: (21, self._equipment_name)},
+            fetch_more=self._fetch_next_page,
+            parent=self
+        )
+
+        # Delegates are stateless (combo lists aside) - one instance each, owned by the tab
+        self._combo_delegate = ComboDelegate(self, {})
+        self._date_delegate = DateDelegate(self)
+        self._recipe_delegate = RecipeDelegate(self, equip_col=20)
+        self._noedit_delegate = NoEditDelegate(self)
+        self._load_gen = 0
+        self._saving = False  # ignore our own request_updated("batch")
+        self._worker = None
+        self._page_worker = None
+        self._export_worker = None
+        self._combo_cache = None  # {col: [values]} from lookup tables, reused across loads
+        self._widths_fitted = False
         self.log_path = self._load_log_path()
-        self._changed_rows = set()  # Track changed rows
+
+        # Coalesces rapid filter changes into one load
+        self._reload_timer = QTimer(self)
+        self._reload_timer.setSingleShot(True)
+        self._reload_timer.setInterval(self.RELOAD_DELAY_MS)
+        self._reload_timer.timeout.connect(self._load_data)
 
         self._setup_ui()
         self._connect_events()
@@ -94,6 +151,13 @@ class EditTab(QWidget, LoadingMixin):
         """Connect to DataEventBus events"""
         bus = get_event_bus()
         bus.request_created.connect(lambda _: self._refresh())
+        bus.request_updated.connect(self._on_request_changed)
+        bus.lookup_changed.connect(self._invalidate_combo_cache)
+        bus.equipment_changed.connect(self._invalidate_combo_cache)
+
+    def _invalidate_combo_cache(self, *_):
+        """Lookup/equipment data changed - rebuild combo lists on next load"""
+        self._combo_cache = None
 
     def _setup_ui(self):
         """Setup UI với giao diện đẹp"""
@@ -124,7 +188,7 @@ class EditTab(QWidget, LoadingMixin):
         self.cb_filter_status = QComboBox()
         self.cb_filter_status.setMinimumWidth(150)
         self.cb_filter_status.setStyleSheet(self._combo_style())
-        self.cb_filter_status.currentTextChanged.connect(lambda _: self._load_data())
+        self.cb_filter_status.currentTextChanged.connect(self._schedule_reload)
         layout.addWidget(self.cb_filter_status)
 
         # Result filter
@@ -132,7 +196,7 @@ class EditTab(QWidget, LoadingMixin):
         self.cb_filter_result.addItems(["Tất cả KQ", "-", "Pass", "Fail", "Waiver"])
         self.cb_filter_result.setMinimumWidth(120)
         self.cb_filter_result.setStyleSheet(self._combo_style())
-        self.cb_filter_result.currentTextChanged.connect(lambda _: self._load_data())
+        self.cb_filter_result.currentTextChanged.connect(self._schedule_reload)
         layout.addWidget(self.cb_filter_result)
 
         layout.addStretch()
@@ -150,14 +214,14 @@ class EditTab(QWidget, LoadingMixin):
         btn_refresh = QPushButton("🔄 Tải lại")
         btn_refresh.setCursor(Qt.CursorShape.PointingHandCursor)
         btn_refresh.clicked.connect(self._refresh)
-        btn_refresh.setStyleSheet(BTN_STYLE_BLUE)
+        style_button(btn_refresh, "Blue")
         layout.addWidget(btn_refresh)
 
         # Delete button
         btn_delete = QPushButton("🗑️ Xóa")
         btn_delete.setCursor(Qt.CursorShape.PointingHandCursor)
         btn_delete.clicked.connect(self._delete_selected)
-        btn_delete.setStyleSheet(BTN_STYLE_RED)
+        style_button(btn_delete, "Red")
         btn_delete.setToolTip("Xóa các bản ghi đã chọn")
         layout.addWidget(btn_delete)
 
@@ -167,14 +231,14 @@ class EditTab(QWidget, LoadingMixin):
         btn_save = QPushButton("💾 Lưu thay đổi")
         btn_save.setCursor(Qt.CursorShape.PointingHandCursor)
         btn_save.clicked.connect(self._save)
-        btn_save.setStyleSheet(BTN_STYLE_GREEN_SOLID)
+        style_button(btn_save, "GreenSolid")
         layout.addWidget(btn_save)
 
         # Export button
         btn_export = QPushButton("📤 Xuất CSV")
         btn_export.setCursor(Qt.CursorShape.PointingHandCursor)
         btn_export.clicked.connect(self._export_csv)
-        btn_export.setStyleSheet(BTN_STYLE_ORANGE_SOLID)
+        style_button(btn_export, "OrangeSolid")
         layout.addWidget(btn_export)
 
         parent_layout.addWidget(toolbar)
@@ -200,20 +264,17 @@ class EditTab(QWidget, LoadingMixin):
     def _init_filter_list(self):
         """Initialize status filter list"""
         try:
-            current = self.cb_filter_status.currentText()
-            self.cb_filter_status.blockSignals(True)
+            # Cached by LookupService, cleared on lookup_changed
+            names = get_lookup_service().get_lookup_values("status")
+        except Exception:
+            return
+
+        current = self.cb_filter_status.currentText()
+        with QSignalBlocker(self.cb_filter_status):
             self.cb_filter_status.clear()
             self.cb_filter_status.addItem("Tất cả Trạng thái")
-
-            rows = self.db.fetch_all("SELECT name FROM status ORDER BY name")
-            for row in rows:
-                if row[0]:
-                    self.cb_filter_status.addItem(row[0])
-
+            self.cb_filter_status.addItems(names)
             self.cb_filter_status.setCurrentText(current)
-            self.cb_filter_status.blockSignals(False)
-        except Exception:
-            pass
 
     def _refresh(self):
         """Refresh data"""
@@ -221,34 +282,22 @@ class EditTab(QWidget, LoadingMixin):
         self._init_filter_list()
         self._load_data()
 
-    def _load_data(self):
-        """Load data into table"""
-        self.show_loading("Đang tải dữ liệu...")
-        try:
-            self._do_load_data()
-        finally:
-            self.hide_loading()
+    def _build_query(self, request_no: str = None, before_id: int = None,
+                     paged: bool = False):
+        """Build SELECT query from current filters
 
-    def _do_load_data(self):
-        """Internal data loading logic"""
-        # Build combo data
-        data = {}
-        for col, table in self.COL_MAP.items():
-            if table == "equipment":
-                rows = self.db.fetch_all(
-                    "SELECT control_no FROM equipment ORDER BY control_no"
-                )
-            else:
-                rows = self.db.fetch_all(f"SELECT name FROM {table} ORDER BY name")
-            data[col] = [""] + [r[0] for r in rows if r[0]]
+        request_no: a single request; before_id: only rows with a smaller id
+        (next page); paged: limit to PAGE_SIZE rows
+        """
+        conditions, params = [], []
 
-        # Add result dropdown for result columns
-        result_options = ["", "-", "Pass", "Fail", "Waiver"]
-        for col in self.RESULT_COLS:
-            data[col] = result_options
+        if request_no:
+            conditions.append("request_no=?")
+            params.append(request_no)
 
-        # Build query with filters
-        conditions, params = [], []
+        if before_id is not None:
+            conditions.append("id<?")
+            params.append(before_id)
 
         status = self.cb_filter_status.currentText()
         result = self.cb_filter_result.currentText()
@@ -261,83 +310,147 @@ class EditTab(QWidget, LoadingMixin):
             conditions.append("final_res=?")
             params.append(result)
 
-        where = " WHERE " + " AND ".join(conditions) if conditions else ""
-        cols = ", ".join(DB_SELECT_COLS)
-        query = f"SELECT {cols} FROM requests {where} ORDER BY id DESC"
-
-        # Load data
-        conn = self.db.connect()
-        df = pd.read_sql_query(query, conn, params=tuple(params))
-
-        # Build model
-        self.model = QStandardItemModel()
-        self.model.setHorizontalHeaderLabels(self.HEADERS)
-
-        lemon_bg = QColor("#FFF9C4")
-        white_bg = QColor("#FFFFFF")
-
-        # Text colors for results and status
-        result_colors = {
-            "Pass": QColor("#2E7D32"),    # Green
-            "Fail": QColor("#C62828"),    # Red
-            "Waiver": QColor("#F57C00"),  # Orange
-            "-": QColor("#757575")        # Gray
-        }
-        status_colors = {
-            "Done": QColor("#2E7D32"),
-            "Finish": QColor("#2E7D32"),
-            "Ongoing": QColor("#1565C0"),
-            "Running": QColor("#1565C0"),
-            "Pending": QColor("#F57C00"),
-            "Wait": QColor("#F57C00"),
-            "Stop": QColor("#C62828"),
-            "Cancel": QColor("#9E9E9E"),
-            "Not Start": QColor("#757575")
-        }
-
-        for _, row in df.iterrows():
-            items = []
-            for col_idx, v in enumerate(row):
-                # Handle None, NaN, and empty values
-                # Also handle string "nan" from pandas conversion
-                if v is None or (isinstance(v, float) and pd.isna(v)):
-                    val = ""
-                elif pd.isna(v):  # Catch any other NaN types
-                    val = ""
-                else:
-                    val = str(v).strip()
-                    # Handle string "nan" or "None" from pandas
-                    if val.lower() in ("nan", "none", "nat"):
-                        val = ""
-
-                item = QStandardItem(val)
-
-                # Set background yellow for empty cells
-                if not val:
-                    item.setBackground(lemon_bg)
-                else:
-                    item.setBackground(white_bg)
-
-                # Set text color for status column (col 0)
-                if col_idx == 0 and val in status_colors:
-                    item.setForeground(status_colors[val])
-
-                # Set text color for result columns (15-19)
-                if col_idx in self.RESULT_COLS and val in result_colors:
-                    item.setForeground(result_colors[val])
-
-                items.append(item)
-
-            self.model.appendRow(items)
-
-        self.model.itemChanged.connect(self._on_item_changed)
-        self._changed_rows.clear()  # Reset changed rows after load
-
-        # Create table
-        if self.table:
-            self.table_container.removeWidget(self.table)
-            self.table.deleteLater()
+        if paged:
+            params.insert(0, self.PAGE_SIZE)
+        return _select_sql(tuple(conditions), paged), tuple(params)
+
+    def _on_request_changed(self, request_no: str):
+        """Another tab changed a request - refresh just that row when possible"""
+        if self._saving or self.table is None:
+            return
+        if not request_no or request_no.startswith("batch"):
+            self._schedule_reload()
+            return
+
+        try:
+            # Same filters as the table, so rows that no longer match drop out
+            query, params = self._build_query(request_no)
+            row_data = self.db.fetch_one(query, params)
+        except Exception as e:
+            logger.error(f"Failed to refresh request {request_no}: {e}")
+            return
+
+        r = self.model.find_row(self.REQUEST_NO_COL, request_no)
+        if row_data is None:
+            if r >= 0:
+                self.model.remove_rows([r])
+                self._refill_if_empty()
+        elif r >= 0:
+            self.model.replace_row(r, row_data)
+        else:
+            last_id = self._last_loaded_id()
+            if not self.model.has_more or last_id is None or int(row_data[1]) > last_id:
+                # Older rows outside the loaded pages arrive with their page
+                self.model.insert_row(0, row_data)
+
+    def _schedule_reload(self, *_):
+        """Debounced reload (restarts the timer on every call)"""
+        self._reload_timer.start()
 
+    def _load_data(self):
+        """Load data into table (query runs on the thread pool)"""
+        # A direct load supersedes any pending debounced one
+        self._reload_timer.stop()
+        # Newer loads supersede older ones - stale results are dropped
+        self._load_gen += 1
+        # Pages computed from the rows on screen would mix with the new result
+        self.model.begin_reload()
+        query, params = self._build_query(paged=True)
+
+        # Overlay only appears for loads slower than 200 ms
+        self.show_loading_deferred("Đang tải dữ liệu...")
+        # Combo lists are only queried when not cached
+        combo_tables = self.COL_MAP if self._combo_cache is None else {}
+        worker = LoadRequestsWorker(self._load_gen, query, params, combo_tables)
+        worker.signals.finished.connect(self._on_loaded)
+        worker.signals.failed.connect(self._on_load_failed)
+        self._worker = worker
+        QThreadPool.globalInstance().start(worker)
+
+    def _last_loaded_id(self):
+        """id of the bottom row (rows are ordered by id DESC), None if no rows"""
+        if self.model.rowCount() == 0:
+            return None
+        return int(self.model.value(self.model.rowCount() - 1, 1))
+
+    def _refill_if_empty(self):
+        """Every loaded row was removed but the DB has more - start from the first page"""
+        if self.model.rowCount() == 0 and self.model.has_more:
+            self._load_data()
+
+    def _fetch_next_page(self):
+        """Load the page after the bottom row (called by the model while scrolling)"""
+        last_id = self._last_loaded_id()
+        if last_id is None:
+            # No bottom row to page from - a fresh first page instead
+            self._load_data()
+            return
+        query, params = self._build_query(before_id=last_id, paged=True)
+        worker = LoadRequestsWorker(self._load_gen, query, params, {})
+        worker.signals.finished.connect(self._on_page_loaded)
+        worker.signals.failed.connect(self._on_page_failed)
+        self._page_worker = worker
+        QThreadPool.globalInstance().start(worker)
+
+    def _on_page_loaded(self, generation: int, rows, _data: dict):
+        """Append a page (dropped if a full reload happened meanwhile)"""
+        if generation != self._load_gen:
+            return
+        self._page_worker = None
+        self.model.append_rows(rows, has_more=len(rows) >= self.PAGE_SIZE)
+
+    def _on_page_failed(self, generation: int, message: str):
+        """Stop paging after an error (a refresh starts over)"""
+        if generation != self._load_gen:
+            return
+        self._page_worker = None
+        logger.error(f"Failed to load next page: {message}")
+        self.model.append_rows([], has_more=False)
+
+    def _on_load_failed(self, generation: int, message: str):
+        """Handle worker error"""
+        if generation != self._load_gen:
+            return
+        self._worker = None
+        self.model.cancel_reload()
+        self.hide_loading()
+        QMessageBox.critical(self, "Lỗi", message)
+
+    def _on_loaded(self, generation: int, rows, data: dict):
+        """Apply loaded data (GUI thread)"""
+        if generation != self._load_gen:
+            return
+        self._worker = None
+        if data:
+            self._combo_cache = data
+        try:
+            self._apply_loaded(rows, dict(self._combo_cache or {}))
+        finally:
+            self.hide_loading()
+
+    def _apply_loaded(self, rows, data: dict):
+        """Build table from loaded rows"""
+        # Add result dropdown for result columns
+        result_options = ["", "-", "Pass", "Fail", "Waiver"]
+        for col in self.RESULT_COLS:
+            data[col] = result_options
+
+        # Update model (cells are converted to strings once, colors resolved lazily)
+        self.model.set_rows(rows, has_more=len(rows) >= self.PAGE_SIZE)
+
+        # Table and delegates are created once; later loads only reset the model
+        if self.table is None:
+            self._create_table()
+        self._combo_delegate.set_data_source(data)
+        self._date_delegate.clear_cache()
+        self._noedit_delegate.clear_cache()
+
+        # Widths are fitted once from real data, then left to the user
+        if not self._widths_fitted:
+            self._fit_column_widths()
+
+    def _create_table(self):
+        """Create table view, delegates and column widths"""
         self.table = QTableView()
         self.table.setModel(self.model)
         # Custom style - remove background from item to let delegate paint it
@@ -380,99 +493,69 @@ class EditTab(QWidget, LoadingMixin):
         self.table.setSelectionBehavior(QTableView.SelectionBehavior.SelectRows)
         self.table.setSelectionMode(QTableView.SelectionMode.ExtendedSelection)
         self.table.doubleClicked.connect(self._handle_double_click)
-        self._setup_delegates(data)
+        self._setup_delegates()
         self._setup_column_widths()
         self.table_container.addWidget(self.table)
 
-    def _setup_delegates(self, data: dict):
-        """Setup table delegates"""
-        self.table.setItemDelegate(ComboDelegate(self.table, data))
+    def _setup_delegates(self):
+        """Install the shared delegates on the table"""
+        self.table.setItemDelegate(self._combo_delegate)
 
         # Date delegate for all date columns
-        dd = DateDelegate(self.table)
         for col in self.DATE_COLS:
-            self.table.setItemDelegateForColumn(col, dd)
+            self.table.setItemDelegateForColumn(col, self._date_delegate)
 
         # RecipeDelegate for test_condition (col 22), references equip_no (col 20)
-        self.table.setItemDelegateForColumn(22, RecipeDelegate(self.table, equip_col=20))
+        self.table.setItemDelegateForColumn(22, self._recipe_delegate)
         # NoEditDelegate for logfile (col 28)
-        self.table.setItemDelegateForColumn(28, NoEditDelegate(self.table))
+        self.table.setItemDelegateForColumn(28, self._noedit_delegate)
 
     def _setup_column_widths(self):
         """Setup column widths"""
         h = self.table.horizontalHeader()
-        h.setSectionResizeMode(QHeaderView.ResizeMode.ResizeToContents)
+        # Interactive instead of ResizeToContents (which measures every cell on every reset)
+        h.setSectionResizeMode(QHeaderView.ResizeMode.Interactive)
         # Set specific widths for first columns: Trạng thái, ID, Mã YC, Ngày YC
-        col_widths = [90, 50, 110, 95]  # Increased Trạng thái width
-        for i, w in enumerate(col_widths):
+        for i, w in enumerate(self.FIXED_COL_WIDTHS):
             h.setSectionResizeMode(i, QHeaderView.ResizeMode.Fixed)
             self.table.setColumnWidth(i, w)
-        h.setSectionResizeMode(30, QHeaderView.ResizeMode.Stretch)  # note column
+        h.setStretchLastSection(True)  # note column
 
         # Set row height
         self.table.verticalHeader().setDefaultSectionSize(32)
 
-    def _on_item_changed(self, item):
-        """Handle item change"""
-        # Track changed row
-        self._changed_rows.add(item.row())
-
-        val = item.text().strip()
+    def _fit_column_widths(self):
+        """Size columns from header text + first rows only"""
+        fm = self.table.fontMetrics()
+        header_fm = self.table.horizontalHeader().fontMetrics()
+        sample = min(self.WIDTH_SAMPLE_ROWS, self.model.rowCount())
+        # One repaint for all width changes instead of one per column
+        self.table.setUpdatesEnabled(False)
+        try:
+            for col in range(len(self.FIXED_COL_WIDTHS), self.model.columnCount()):
+                w = header_fm.horizontalAdvance(self.HEADERS[col])
+                for row in range(sample):
+                    w = max(w, fm.horizontalAdvance(self.model.value(row, col)))
+                self.table.setColumnWidth(col, min(w + 24, self.MAX_COL_WIDTH))
+        finally:
+            self.table.setUpdatesEnabled(True)
+        self._widths_fitted = sample > 0
 
-        if not val:
-            item.setBackground(QColor("#FFF9C4"))
-        else:
-            item.setBackground(QColor("white"))
-
-        col = item.column()
-
-        # Update text color for status column (col 0)
-        if col == 0:
-            status_colors = {
-                "Done": QColor("#2E7D32"), "Finish": QColor("#2E7D32"),
-                "Ongoing": QColor("#1565C0"), "Running": QColor("#1565C0"),
-                "Pending": QColor("#F57C00"), "Wait": QColor("#F57C00"),
-                "Stop": QColor("#C62828"), "Cancel": QColor("#9E9E9E"),
-                "Not Start": QColor("#757575")
-            }
-            if val in status_colors:
-                item.setForeground(status_colors[val])
-            else:
-                item.setForeground(QColor("#212121"))
-
-        # Update text color for result columns (15-19)
-        if col in self.RESULT_COLS:
-            result_colors = {
-                "Pass": QColor("#2E7D32"), "Fail": QColor("#C62828"),
-                "Waiver": QColor("#F57C00"), "-": QColor("#757575")
-            }
-            if val in result_colors:
-                item.setForeground(result_colors[val])
-            else:
-                item.setForeground(QColor("#212121"))
-
-        # Auto-fill equipment name (equip_no is col 20, equip_name is col 21)
-        if col == 20:
-            equip_no = val
-            if equip_no:
-                try:
-                    rows = self.db.fetch_all(
-                        "SELECT name FROM equipment WHERE control_no=?",
-                        (equip_no,)
-                    )
-                    if rows:
-                        self.model.blockSignals(True)
-                        self.model.setItem(item.row(), 21, QStandardItem(rows[0][0]))
-                        self.model.blockSignals(False)
-                except Exception:
-                    pass
+    @staticmethod
+    def _equipment_name(equip_no: str):
+        """Equipment name for autofill (None if unknown)"""
+        try:
+            equip = get_lookup_service().get_equipment_by_id(equip_no)
+        except Exception:
+            return None
+        return equip.name if equip else None
 
     def _handle_double_click(self, index):
         """Handle double click for log file selection"""
         # logfile is col 28
         if index.column() == 28:
             row = index.row()
-            req_no = self.model.item(row, 2).text().strip()  # request_no is col 2
+            req_no = self.model.value(row, 2).strip()  # request_no is col 2
 
             if not req_no:
                 return QMessageBox.warning(self, "Lỗi", "Cần có Mã Yêu Cầu!")
@@ -483,11 +566,11 @@ class EditTab(QWidget, LoadingMixin):
                     dest_dir = os.path.join(self.log_path, req_no)
                     os.makedirs(dest_dir, exist_ok=True)
                     dest_path = os.path.join(dest_dir, os.path.basename(fname))
-                    shutil.copy(fname, dest_path)
+                    fast_copy(fname, dest_path)
 
                     # logfile is col 28, log_link is col 29
-                    self.model.item(row, 28).setText(os.path.basename(fname))
-                    self.model.item(row, 29).setText(dest_path)
+                    self.model.setData(self.model.index(row, 28), os.path.basename(fname))
+                    self.model.setData(self.model.index(row, 29), dest_path)
 
                     QMessageBox.information(self, "OK", f"Đã tải: {os.path.basename(fname)}")
                 except Exception as e:
@@ -495,60 +578,40 @@ class EditTab(QWidget, LoadingMixin):
 
     def _save(self):
         """Save only changed rows"""
-        if not self._changed_rows:
+        if not self.model.dirty_rows:
             QMessageBox.information(self, "Thông báo", "Không có thay đổi để lưu!")
             return
 
+        # The model already shows the saved values - no reload afterwards.
+        # Model columns follow DB_SELECT_COLS: drop id (col 1) for SET, append it for WHERE
+        params = []
+        for r in sorted(self.model.dirty_rows):
+            if r >= self.model.rowCount():
+                continue
+            row_data = self.model.row_values(r)
+            record_id = row_data[1]
+            if record_id:
+                params.append((row_data[0], *row_data[2:], record_id))
+
         try:
-            updated_count = 0
+            # One prepared statement, one round-trip batch, one commit
             with self.db.get_cursor() as cursor:
-                for r in self._changed_rows:
-                    if r >= self.model.rowCount():
-                        continue
-
-                    row_data = [
-                        self.model.item(r, c).text() if self.model.item(r, c) else ""
-                        for c in range(self.model.columnCount())
-                    ]
-
-                    # Column order: status, id, request_no, request_date, requester, factory, project,
-                    # phase, category, detail, qty, cos, hcross, xcross, func_test,
-                    # cos_res, xhatch_res, xsection_res, func_res, final_res,
-                    # equip_no, equip_name, test_condition, plan_start, plan_end, dri,
-                    # actual_start, actual_end, logfile, log_link, note
-                    record_id = row_data[1]  # id is now col 1
-                    if not record_id:
-                        continue
-
-                    cursor.execute("""
-                        UPDATE requests SET
-                            status=?, request_no=?, request_date=?, requester=?, factory=?,
-                            project=?, phase=?, category=?, detail=?, qty=?,
-                            cos=?, hcross=?, xcross=?, func_test=?,
-                            cos_res=?, xhatch_res=?, xsection_res=?, func_res=?, final_res=?,
-                            equip_no=?, equip_name=?, test_condition=?,
-                            plan_start=?, plan_end=?, dri=?,
-                            actual_start=?, actual_end=?, logfile=?, log_link=?, note=?
-                        WHERE id=?
-                    """, (
-                        row_data[0], row_data[2], row_data[3], row_data[4], row_data[5],
-                        row_data[6], row_data[7], row_data[8], row_data[9], row_data[10],
-                        row_data[11], row_data[12], row_data[13], row_data[14],
-                        row_data[15], row_data[16], row_data[17], row_data[18], row_data[19],
-                        row_data[20], row_data[21], row_data[22],
-                        row_data[23], row_data[24], row_data[25],
-                        row_data[26], row_data[27], row_data[28], row_data[29], row_data[30],
-                        record_id
-                    ))
-                    updated_count += 1
+                if params:
+                    cursor.fast_executemany = True
+                    cursor.executemany(_UPDATE_SQL, params)
+            updated_count = len(params)
 
             logger.info(f"Saved {updated_count} records")
             log_audit("DATA_SAVE", details=f"Updated {updated_count} records")
 
             if updated_count > 0:
-                get_event_bus().emit_request_updated("batch")
+                self._saving = True
+                try:
+                    get_event_bus().emit_request_updated("batch")
+                finally:
+                    self._saving = False
 
-            self._changed_rows.clear()
+            self.model.dirty_rows.clear()
             QMessageBox.information(self, "Thành công", f"Đã lưu {updated_count} bản ghi!")
 
         except Exception as e:
@@ -562,34 +625,27 @@ class EditTab(QWidget, LoadingMixin):
         )
 
         if path:
-            try:
-                conditions, params = [], []
-                status = self.cb_filter_status.currentText()
-                result = self.cb_filter_result.currentText()
-
-                if status and status != "Tất cả Trạng thái":
-                    conditions.append("status=?")
-                    params.append(status)
-
-                if result and result != "Tất cả KQ":
-                    conditions.append("final_res=?")
-                    params.append(result)
-
-                where = " WHERE " + " AND ".join(conditions) if conditions else ""
-                cols = ", ".join(DB_SELECT_COLS)
-                query = f"SELECT {cols} FROM requests {where} ORDER BY id DESC"
-
-                conn = self.db.connect()
-                df = pd.read_sql_query(query, conn, params=tuple(params))
-
-                if len(df.columns) == len(self.HEADERS):
-                    df.columns = self.HEADERS
-
-                df.to_csv(path, index=False, encoding='utf-8-sig')
-                QMessageBox.information(self, "OK", "Đã xuất!")
-
-            except Exception as e:
-                QMessageBox.critical(self, "Lỗi", str(e))
+            # Rows are streamed cursor -> file on the thread pool (no DataFrame copy)
+            query, params = self._build_query()
+            self.show_loading("Đang xuất dữ liệu...")
+            worker = ExportCsvWorker(path, query, params, self.HEADERS)
+            worker.signals.finished.connect(self._on_export_finished)
+            worker.signals.failed.connect(self._on_export_failed)
+            self._export_worker = worker
+            QThreadPool.globalInstance().start(worker)
+
+    def _on_export_finished(self, path: str, count: int):
+        """Export done"""
+        self._export_worker = None
+        self.hide_loading()
+        logger.info(f"Exported {count} records to {path}")
+        QMessageBox.information(self, "OK", "Đã xuất!")
+
+    def _on_export_failed(self, message: str):
+        """Export error"""
+        self._export_worker = None
+        self.hide_loading()
+        QMessageBox.critical(self, "Lỗi", message)
 
     def _delete_selected(self):
         """Delete selected rows"""
@@ -607,11 +663,13 @@ class EditTab(QWidget, LoadingMixin):
         # Get request_no for confirmation (id is col 1, request_no is col 2)
         request_nos = []
         ids_to_delete = []
+        rows_to_delete = []
         for row in selected_rows:
-            record_id = self.model.item(row, 1).text() if self.model.item(row, 1) else ""
-            request_no = self.model.item(row, 2).text() if self.model.item(row, 2) else ""
+            record_id = self.model.value(row, 1)
+            request_no = self.model.value(row, 2)
             if record_id:
                 ids_to_delete.append(record_id)
+                rows_to_delete.append(row)
                 request_nos.append(request_no or record_id)
 
         if not ids_to_delete:
@@ -631,9 +689,11 @@ class EditTab(QWidget, LoadingMixin):
         try:
             deleted = 0
             with self.db.get_cursor() as cursor:
-                for record_id in ids_to_delete:
-                    cursor.execute("DELETE FROM requests WHERE id = ?", (record_id,))
-                    deleted += 1
+                for i in range(0, count, self.DELETE_CHUNK):
+                    chunk = ids_to_delete[i:i + self.DELETE_CHUNK]
+                    placeholders = ",".join("?" * len(chunk))
+                    cursor.execute(f"DELETE FROM requests WHERE id IN ({placeholders})", chunk)
+                    deleted += cursor.rowcount
 
             logger.info(f"Deleted {deleted} records")
             log_audit("DATA_DELETE", details=f"Deleted {deleted} records: {', '.join(request_nos[:5])}")
@@ -641,8 +701,10 @@ class EditTab(QWidget, LoadingMixin):
             if deleted > 0:
                 get_event_bus().emit_request_deleted("batch")
 
+            # Drop the rows from the model instead of reloading everything
+            self.model.remove_rows(rows_to_delete)
+            self._refill_if_empty()
             QMessageBox.information(self, "Thành công", f"Đã xóa {deleted} bản ghi!")
-            self._load_data()
 
         except Exception as e:
             logger.error(f"Failed to delete: {e}", exc_info=True)
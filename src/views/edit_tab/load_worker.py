@@ -0,0 +1,115 @@
+"""
+kRel - Edit Tab Workers
+Chạy truy vấn tải / xuất dữ liệu trên thread pool, trả kết quả về GUI thread qua signal
+"""
+import csv
+
+from PyQt6.QtCore import QObject, QRunnable, pyqtSignal
+
+from src.services.database import get_db
+from src.services.logger import get_logger
+
+logger = get_logger("edit_tab")
+
+
+def build_combo_query(combo_tables: dict) -> str:
+    """One UNION ALL query for all combo lists -> rows of (col, value)"""
+    parts = [
+        f"SELECT {int(col)}, {'control_no' if table == 'equipment' else 'name'} FROM {table}"
+        for col, table in combo_tables.items()
+    ]
+    return " UNION ALL ".join(parts) + " ORDER BY 1, 2"
+
+
+class LoadSignals(QObject):
+    """Signals for LoadRequestsWorker (delivered on the GUI thread)"""
+    finished = pyqtSignal(int, object, dict)  # generation, rows, combo data
+    failed = pyqtSignal(int, str)             # generation, error message
+
+
+class LoadRequestsWorker(QRunnable):
+    """Load request rows and combo lists on a worker thread"""
+
+    def __init__(self, generation: int, query: str, params: tuple, combo_tables: dict):
+        super().__init__()
+        self.generation = generation
+        self.query = query
+        self.params = params
+        self.combo_tables = combo_tables  # {col: table name}
+        self.signals = LoadSignals()
+
+    def run(self):
+        conn = None
+        try:
+            # Own connection - pyodbc connections are not thread-safe
+            conn = get_db().open_connection()
+            cursor = conn.cursor()
+
+            # All combo lists in a single round-trip
+            combo_data = {}
+            if self.combo_tables:
+                combo_data = {col: [""] for col in self.combo_tables}
+                cursor.execute(build_combo_query(self.combo_tables))
+                for col, value in cursor.fetchall():
+                    if value:
+                        combo_data[col].append(value)
+
+            # Plain tuples straight from the cursor - no DataFrame on the hot path
+            cursor.execute(self.query, self.params)
+            rows = cursor.fetchall()
+            self.signals.finished.emit(self.generation, rows, combo_data)
+        except Exception as e:
+            logger.error(f"Failed to load data: {e}", exc_info=True)
+            self.signals.failed.emit(self.generation, str(e))
+        finally:
+            if conn is not None:
+                try:
+                    conn.close()
+                except Exception:
+                    pass
+
+
+class ExportSignals(QObject):
+    """Signals for ExportCsvWorker"""
+    finished = pyqtSignal(str, int)  # path, row count
+    failed = pyqtSignal(str)         # error message
+
+
+class ExportCsvWorker(QRunnable):
+    """Stream query results straight from the cursor into a CSV file"""
+
+    FETCH_SIZE = 1000
+
+    def __init__(self, path: str, query: str, params: tuple, headers: list):
+        super().__init__()
+        self.path = path
+        self.query = query
+        self.params = params
+        self.headers = headers
+        self.signals = ExportSignals()
+
+    def run(self):
+        conn = None
+        try:
+            conn = get_db().open_connection()
+            cursor = conn.cursor()
+            cursor.execute(self.query, self.params)
+
+            count = 0
+            with open(self.path, "w", encoding="utf-8-sig", newline="") as f:
+                writer = csv.writer(f)
+                writer.writerow(self.headers)
+                while rows := cursor.fetchmany(self.FETCH_SIZE):
+                    writer.writerows(rows)
+                    count += len(rows)
+
+            self.signals.finished.emit(self.path, count)
+        except Exception as e:
+            logger.error(f"Failed to export CSV: {e}", exc_info=True)
+            self.signals.failed.emit(str(e))
+        finally:
+            if conn is not None:
+                try:
+                    conn.close()
+                except Exception:
+                    pass
@@ -0,0 +1,292 @@
+"""
+kRel - Requests Table Model
+Model cho bảng Edit tab - dữ liệu được trả về theo yêu cầu (chỉ ô đang hiển thị)
+"""
+from typing import List
+
+from PyQt6.QtCore import Qt, QAbstractTableModel, QModelIndex
+from PyQt6.QtGui import QBrush, QColor
+import numpy as np
+
+# Cell brushes (shared instances, never created per cell)
+_BRUSH_CACHE = {}
+
+
+def _brush(hex_color: str) -> QBrush:
+    """Shared QBrush per color (statuses with the same color share one brush)"""
+    brush = _BRUSH_CACHE.get(hex_color)
+    if brush is None:
+        brush = _BRUSH_CACHE[hex_color] = QBrush(QColor(hex_color))
+    return brush
+
+
+# Backgrounds are brushes so delegates can fillRect them directly
+LEMON_BRUSH = _brush("#FFF9C4")
+WHITE_BRUSH = _brush("#FFFFFF")
+TEXT_BRUSH = _brush("#212121")
+
+STATUS_BRUSHES = {
+    "Done": _brush("#2E7D32"),
+    "Finish": _brush("#2E7D32"),
+    "Ongoing": _brush("#1565C0"),
+    "Running": _brush("#1565C0"),
+    "Pending": _brush("#F57C00"),
+    "Wait": _brush("#F57C00"),
+    "Stop": _brush("#C62828"),
+    "Cancel": _brush("#9E9E9E"),
+    "Not Start": _brush("#757575"),
+}
+
+RESULT_BRUSHES = {
+    "Pass": _brush("#2E7D32"),
+    "Fail": _brush("#C62828"),
+    "Waiver": _brush("#F57C00"),
+    "-": _brush("#757575"),
+}
+
+# Roles that change when a cell value changes (views skip other roles)
+_VALUE_ROLES = [
+    Qt.ItemDataRole.DisplayRole, Qt.ItemDataRole.EditRole,
+    Qt.ItemDataRole.BackgroundRole, Qt.ItemDataRole.ForegroundRole,
+]
+
+# Text values treated as missing data
+_NULL_TOKENS = frozenset(("nan", "none", "nat"))
+
+
+def _clean_cell(value) -> str:
+    """DB value -> stripped string (missing -> "")"""
+    if value is None:
+        return ""
+    text = str(value).strip()
+    return "" if text.lower() in _NULL_TOKENS else text
+
+
+def clean_rows(rows) -> List[list]:
+    """Convert DB rows (tuples) to mutable rows of strings"""
+    return [[_clean_cell(v) for v in row] for row in rows]
+
+
+class RequestsTableModel(QAbstractTableModel):
+    """Table model for requests - stores plain strings, colors computed in data()"""
+
+    def __init__(self, headers: List[str], status_col: int = 0,
+                 result_cols=(), readonly_cols=(), autofill=None, fetch_more=None,
+                 parent=None):
+        """
+        autofill: {source_col: (target_col, resolve)} - editing source_col writes
+        resolve(value) into target_col when it returns a value
+        fetch_more: callback that loads the next page and passes it to append_rows()
+        """
+        super().__init__(parent)
+        self._headers = list(headers)
+        self._autofill = autofill or {}
+        self._fetch_more = fetch_more
+        self._has_more = False
+        self._fetching = False
+        self._reloading = False
+        self._rows: List[list] = []
+        self._readonly_cols = frozenset(readonly_cols)
+        self.dirty_rows = set()
+
+        # Columns with colored text -> {value: QBrush}
+        self._color_maps = {status_col: STATUS_BRUSHES}
+        self._color_maps.update({col: RESULT_BRUSHES for col in result_cols})
+
+        # Precomputed per load: empty-cell mask and text colors per colored column
+        self._empty = np.zeros((0, len(self._headers)), dtype=bool)
+        self._foreground = {}
+
+    def _empty_mask(self, rows) -> np.ndarray:
+        """Empty-cell mask for cleaned rows"""
+        # One elementwise comparison over an object array instead of a Python loop
+        cells = np.empty((len(rows), len(self._headers)), dtype=object)
+        if rows:
+            cells[:] = rows
+        return cells == ""
+
+    def set_rows(self, rows, has_more: bool = False):
+        """Replace all rows with DB rows (sequence of tuples)"""
+        self.beginResetModel()
+        self._rows = clean_rows(rows)
+        ncols = len(self._headers)
+        self._empty = self._empty_mask(self._rows)
+        self._foreground = {
+            col: [colors.get(row[col], TEXT_BRUSH) for row in self._rows]
+            for col, colors in self._color_maps.items() if 0 <= col < ncols
+        }
+        self.dirty_rows.clear()
+        self._has_more = has_more
+        self._fetching = False
+        self._reloading = False
+        self.endResetModel()
+
+    def begin_reload(self):
+        """A full reload is in flight - no paging from the old rows until set_rows()"""
+        self._reloading = True
+
+    def cancel_reload(self):
+        """The reload failed - page the rows that are still shown again"""
+        self._reloading = False
+        self._fetching = False
+
+    def append_rows(self, rows, has_more: bool = False):
+        """Append the next page of DB rows (also ends a pending fetch)"""
+        self._fetching = False
+        self._has_more = has_more
+        if not rows:
+            return
+        cleaned = clean_rows(rows)
+        first = len(self._rows)
+        self.beginInsertRows(QModelIndex(), first, first + len(cleaned) - 1)
+        self._rows.extend(cleaned)
+        self._empty = np.vstack([self._empty, self._empty_mask(cleaned)])
+        for col, colors in self._foreground.items():
+            color_map = self._color_maps[col]
+            colors.extend(color_map.get(row[col], TEXT_BRUSH) for row in cleaned)
+        self.endInsertRows()
+
+    def remove_rows(self, rows):
+        """Remove rows in place (keeps scroll position, no model reset)"""
+        # Contiguous ranges from the bottom up so earlier indexes stay valid
+        ranges = []
+        for r in sorted(set(rows), reverse=True):
+            if ranges and ranges[-1][0] == r + 1:
+                ranges[-1][0] = r
+            else:
+                ranges.append([r, r])
+
+        for first, last in ranges:
+            self.beginRemoveRows(QModelIndex(), first, last)
+            del self._rows[first:last + 1]
+            self._empty = np.delete(self._empty, slice(first, last + 1), axis=0)
+            for colors in self._foreground.values():
+                del colors[first:last + 1]
+            removed = last - first + 1
+            self.dirty_rows = {
+                r - removed if r > last else r
+                for r in self.dirty_rows if not first <= r <= last
+            }
+            self.endRemoveRows()
+
+    @property
+    def has_more(self) -> bool:
+        """More pages are available from the database"""
+        return self._has_more
+
+    def find_row(self, col: int, value: str) -> int:
+        """Index of the first row whose col equals value (-1 if none)"""
+        for r, row in enumerate(self._rows):
+            if row[col] == value:
+                return r
+        return -1
+
+    def replace_row(self, row: int, values):
+        """Overwrite one row with a DB row and repaint only that row"""
+        for col, value in enumerate(clean_rows([values])[0]):
+            self._store(row, col, value)
+        self.dirty_rows.discard(row)
+        self.dataChanged.emit(
+            self.index(row, 0), self.index(row, len(self._headers) - 1), _VALUE_ROLES
+        )
+
+    def insert_row(self, row: int, values):
+        """Insert one DB row at position row"""
+        cleaned = clean_rows([values])[0]
+        self.beginInsertRows(QModelIndex(), row, row)
+        self._rows.insert(row, cleaned)
+        self._empty = np.insert(self._empty, row, [not v for v in cleaned], axis=0)
+        for col, colors in self._foreground.items():
+            colors.insert(row, self._color_maps[col].get(cleaned[col], TEXT_BRUSH))
+        self.dirty_rows = {r + 1 if r >= row else r for r in self.dirty_rows}
+        self.endInsertRows()
+
+    def value(self, row: int, col: int) -> str:
+        """Raw cell text"""
+        return self._rows[row][col]
+
+    def row_values(self, row: int) -> list:
+        """All cell texts of a row"""
+        return list(self._rows[row])
+
+    # ----- QAbstractTableModel interface -----
+
+    def canFetchMore(self, parent=QModelIndex()) -> bool:
+        return (not parent.isValid() and self._has_more and not self._fetching
+                and not self._reloading and self._fetch_more is not None)
+
+    def fetchMore(self, parent=QModelIndex()):
+        # The next page arrives later through append_rows()
+        if self.canFetchMore(parent):
+            self._fetching = True
+            self._fetch_more()
+
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._headers)
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if role != Qt.ItemDataRole.DisplayRole:
+            return None
+        if orientation == Qt.Orientation.Horizontal:
+            return self._headers[section] if section < len(self._headers) else None
+        return str(section + 1)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        row, col = index.row(), index.column()
+
+        if role in (Qt.ItemDataRole.DisplayRole, Qt.ItemDataRole.EditRole):
+            return self._rows[row][col]
+
+        if role == Qt.ItemDataRole.BackgroundRole:
+            return LEMON_BRUSH if self._empty[row, col] else WHITE_BRUSH
+
+        if role == Qt.ItemDataRole.ForegroundRole:
+            colors = self._foreground.get(col)
+            if colors is not None:
+                return colors[row]
+
+        return None
+
+    def flags(self, index):
+        if not index.isValid():
+            return Qt.ItemFlag.NoItemFlags
+        flags = Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsSelectable
+        if index.column() not in self._readonly_cols:
+            flags |= Qt.ItemFlag.ItemIsEditable
+        return flags
+
+    def _store(self, row: int, col: int, value: str):
+        """Write a cell and its cached colors"""
+        self._rows[row][col] = value
+        stripped = value.strip()
+        self._empty[row, col] = not stripped
+        if col in self._foreground:
+            self._foreground[col][row] = self._color_maps[col].get(stripped, TEXT_BRUSH)
+
+    def setData(self, index, value, role=Qt.ItemDataRole.EditRole) -> bool:
+        if not index.isValid() or role != Qt.ItemDataRole.EditRole:
+            return False
+        value = "" if value is None else str(value)
+        row, col = index.row(), index.column()
+        if self._rows[row][col] == value:
+            return True
+        self._store(row, col, value)
+        last_col = col
+
+        # Dependent column filled in the same edit -> one dataChanged for both cells
+        if col in self._autofill:
+            target, resolve = self._autofill[col]
+            filled = resolve(value.strip()) if value.strip() else None
+            if filled is not None:
+                self._store(row, target, filled)
+                last_col = max(col, target)
+                col = min(col, target)
+
+        self.dirty_rows.add(row)
+        self.dataChanged.emit(self.index(row, col), self.index(row, last_col), _VALUE_ROLES)
+        return True
@@ -6,12 +6,13 @@ from PyQt6.QtWidgets import (
     QWidget, QGridLayout, QGroupBox,
     QLabel, QLineEdit, QComboBox, QDateTimeEdit
 )
-from PyQt6.QtCore import QDateTime
+from PyQt6.QtCore import QDateTime, QSignalBlocker
 
 from src.config import TEST_PAIRS, FINAL_RESULTS
 from src.styles import RESULT_FIELD_STYLE
 from src.services.lookup_service import get_lookup_service
 from src.widgets.validated_field import ValidatedField
+from src.widgets.lazy_combo import LazyComboBox
 
 
 class FormBuilder:
@@ -131,9 +132,11 @@ class FormBuilder:
             widget.addItems([""] + FINAL_RESULTS)
             widget.setStyleSheet(RESULT_FIELD_STYLE)
         elif field_name in self.COMBO_FIELDS:
-            widget = QComboBox()
+            # Items nạp khi mở combo lần đầu (không query lookup lúc tạo tab)
+            widget = LazyComboBox()
             widget.setEditable(field_name == "test_condition")
-            self._load_combo(widget, field_name)
+            widget.addItem("")
+            widget.loader = lambda w, f=field_name: self._load_combo(w, f)
         else:
             widget = QLineEdit()
             if field_name == "equip_name":
@@ -150,9 +153,8 @@ class FormBuilder:
         self.widgets[field_name] = widget
     
     def _load_combo(self, combo, field_name):
-        """Load items cho combo box"""
-        combo.clear()
-        combo.addItem("")
+        """Load items cho combo box (giữ lựa chọn hiện tại nếu còn)"""
+        current = combo.currentText()
 
         try:
             if field_name == "equip_no":
@@ -164,12 +166,18 @@ class FormBuilder:
                 }
                 table = table_map.get(field_name)
                 items = self.lookup_service.get_lookup_values(table) if table else []
-
-            for item in items:
-                if item:
-                    combo.addItem(item)
         except Exception:
-            pass
+            items = []
+
+        # One addItems call, no currentTextChanged per item (equip_no has a DB-backed slot)
+        with QSignalBlocker(combo):
+            combo.clear()
+            combo.addItems([""] + [str(item) for item in items if item])
+            if current:
+                combo.setCurrentIndex(max(combo.findText(current), 0))
+
+        if combo.currentText() != current:
+            combo.currentTextChanged.emit(combo.currentText())
 
     def _setup_auto_result(self, src_key, dest_key):
         """Auto-fill kết quả test"""
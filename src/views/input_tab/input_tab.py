@@ -10,7 +10,7 @@ from PyQt6.QtWidgets import (
     QLabel, QLineEdit, QComboBox, QDateTimeEdit, QPushButton,
     QFileDialog, QMessageBox, QGridLayout
 )
-from PyQt6.QtCore import Qt, QDateTime, QDate
+from PyQt6.QtCore import Qt, QDateTime, QDate, QThreadPool, QTimer
 
 from src.config import TEST_PAIRS
 from src.styles import INPUT_TAB_STYLE
@@ -25,6 +25,8 @@ from src.controllers.request_controller import RequestController
 from src.controllers.csv_handler import CsvHandler
 from src.views.input_tab.form_builder import FormBuilder
 from src.views.input_tab.table_section import TableSection
+from src.views.input_tab.save_worker import SaveRequestWorker
+from src.widgets.lazy_combo import LazyComboBox
 
 logger = get_logger("input_tab")
 
@@ -47,6 +49,11 @@ class InputTab(QWidget):
         }
     """
 
+    EQUIP_LOOKUP_DELAY_MS = 200
+
+    # Rows per page of the request list (more are fetched while scrolling)
+    PAGE_SIZE = 100
+
     def __init__(self, log_path: str, user_info: dict, parent=None):
         super().__init__(parent)
         self.log_path = log_path
@@ -59,11 +66,20 @@ class InputTab(QWidget):
         # Services
         self.lookup_service = get_lookup_service()
         self.request_service = get_request_service()
+        self._save_worker = None
+
+        # Debounced equipment lookup - only the last selection within the delay is resolved
+        self._pending_equip = ""
+        self._equip_timer = QTimer(self)
+        self._equip_timer.setSingleShot(True)
+        self._equip_timer.setInterval(self.EQUIP_LOOKUP_DELAY_MS)
+        self._equip_timer.timeout.connect(self._do_equipment_lookup)
 
         os.makedirs(self.log_path, exist_ok=True)
 
         self.setStyleSheet(INPUT_TAB_STYLE)
         self._setup_ui()
+        self._build_getters()
         self._setup_validation()
         self._connect_events()
 
@@ -85,7 +101,7 @@ class InputTab(QWidget):
         self._setup_bottom_section(main_layout)
 
         # Table section
-        self.table_section = TableSection(self)
+        self.table_section = TableSection(self, fetch_more=self._fetch_next_page)
         self.table_section.build_toolbar(
             main_layout,
             on_filter=self._load_recent_requests,
@@ -259,6 +275,7 @@ class InputTab(QWidget):
         btn.setCursor(Qt.CursorShape.PointingHandCursor)
         btn.clicked.connect(self._save)
         btn_layout.addWidget(btn)
+        self.btn_save = btn
         btn_layout.addStretch()
 
         parent_layout.addLayout(btn_layout, stretch=1)
@@ -290,6 +307,9 @@ class InputTab(QWidget):
         # DataEventBus events
         bus = get_event_bus()
         bus.request_updated.connect(lambda _: self._load_recent_requests())
+        # Lookup data edited in Settings -> reload that combo on next use (from cache)
+        bus.lookup_changed.connect(self._reset_combo)
+        bus.equipment_changed.connect(lambda: self._reset_combo("equip_no"))
 
     def _update_request_code(self, date):
         """Cập nhật mã request theo ngày"""
@@ -300,27 +320,53 @@ class InputTab(QWidget):
         code = self.request_service.generate_request_code(dt)
         self.widgets["request_no"].setText(code)
 
+    def _reset_combo(self, field_name: str):
+        """Đánh dấu combo cần nạp lại items (lookup thay đổi)"""
+        widget = self.widgets.get(field_name)
+        if isinstance(widget, LazyComboBox):
+            widget.reset_loaded()
+
     def _on_equipment_change(self, text):
-        """Xử lý thay đổi thiết bị"""
-        equip = self.lookup_service.get_equipment_by_id(text)
+        """Xử lý thay đổi thiết bị (debounce, tra cứu khi ngừng chọn)"""
+        self._pending_equip = text
+        self._equip_timer.start()
+
+    def _do_equipment_lookup(self):
+        """Auto-fill tên thiết bị và recipe cho thiết bị đang chọn"""
+        equip = self.lookup_service.get_equipment_by_id(self._pending_equip)
         if equip:
             self.widgets["equip_name"].setText(equip.name)
             cb = self.widgets["test_condition"]
-            cb.clear()
-            cb.addItems(equip.get_recipes())
+            if isinstance(cb, QComboBox):
+                cb.clear()
+                cb.addItems(equip.get_recipes())
 
     def _on_search(self, text):
         """Xử lý tìm kiếm"""
         if not text.strip():
             self._load_recent_requests()
         else:
+            # Search covers the whole filter range: one unpaged query if pages are missing
+            if self.table_section.model.has_more:
+                filter_idx = self.table_section.get_filter_index()
+                self.table_section.update_table(self.controller.get_recent_requests(filter_idx))
             self.table_section.filter_table(text)
 
     def _load_recent_requests(self):
-        """Load danh sách request gần đây"""
+        """Load danh sách request gần đây (trang đầu)"""
         filter_idx = self.table_section.get_filter_index()
-        rows = self.controller.get_recent_requests(filter_idx)
-        self.table_section.update_table(rows)
+        rows = self.controller.get_recent_requests(filter_idx, limit=self.PAGE_SIZE)
+        self.table_section.update_table(rows, has_more=len(rows) >= self.PAGE_SIZE)
+
+    def _fetch_next_page(self):
+        """Load trang tiếp theo sau row cuối (model gọi khi cuộn tới cuối)"""
+        model = self.table_section.model
+        last_id = model.raw_row(model.rowCount() - 1)[-1]
+        filter_idx = self.table_section.get_filter_index()
+        rows = self.controller.get_recent_requests(
+            filter_idx, limit=self.PAGE_SIZE, before_id=last_id
+        )
+        self.table_section.append_rows(rows, has_more=len(rows) >= self.PAGE_SIZE)
 
     def _pick_log_file(self):
         """Chọn file log"""
@@ -335,67 +381,73 @@ class InputTab(QWidget):
             self.widgets["log_link"].setText(os.path.join(self.log_path, req_no, name))
 
     def _save(self):
-        """Lưu request"""
+        """Lưu request (copy log + INSERT chạy trên worker thread)"""
+        if self._save_worker is not None:
+            return
         try:
             self.form_validator.clear_all_errors()
 
             if not self.form_validator.validate_all():
                 return
 
-            values = self._collect_form_values()
-
-            # Copy log file if selected
-            if hasattr(self.log_label, 'path'):
-                self.controller.copy_log_file(
-                    self.log_label.path,
-                    values.get("request_no", "Unknown")
-                )
+            # Pending equipment auto-fill must land before values are read
+            if self._equip_timer.isActive():
+                self._equip_timer.stop()
+                self._do_equipment_lookup()
 
-            success, msg = self.controller.save(values, self.user_info.get('name', ''))
-
-            if success:
-                QMessageBox.information(self, "Thành công", msg)
-                self._clear_form()
-                self._load_recent_requests()
-            else:
-                QMessageBox.critical(self, "Lỗi", msg)
+            values = self._collect_form_values()
+            worker = SaveRequestWorker(
+                self.controller, values, self.user_info.get('name', ''),
+                getattr(self.log_label, 'path', None)
+            )
+            worker.signals.finished.connect(self._on_save_finished)
+            self._save_worker = worker
+            self.btn_save.setEnabled(False)
+            QThreadPool.globalInstance().start(worker)
 
         except Exception as e:
             logger.error(f"Save error: {e}", exc_info=True)
             QMessageBox.critical(self, "Lỗi", str(e))
 
-    def _collect_form_values(self) -> dict:
-        """Thu thập giá trị từ form"""
-        values = {}
-
-        def get_val(key):
-            if key not in self.widgets:
-                return ""
-            w = self.widgets[key]
-            if key == "request_date":
-                return w.dateTime().toString("yyyy-MM-dd")
+    def _on_save_finished(self, success: bool, msg: str):
+        """Kết quả lưu từ worker (GUI thread)"""
+        self._save_worker = None
+        self.btn_save.setEnabled(True)
+
+        if success:
+            QMessageBox.information(self, "Thành công", msg)
+            self._clear_form()
+            self._load_recent_requests()
+        else:
+            QMessageBox.critical(self, "Lỗi", msg)
+
+    def _build_getters(self):
+        """Tạo sẵn hàm đọc giá trị cho từng field (kiểu widget chỉ xét một lần)"""
+        keys = [key for _, key in FormBuilder.TOP_FIELDS + FormBuilder.BOTTOM_FIELDS]
+        for inp, res, _, _ in TEST_PAIRS:
+            keys += [inp, res]
+        keys += ["log_link", "note", "plan_start", "plan_end", "actual_start", "actual_end"]
+
+        self._getters = []
+        for key in keys:
+            w = self.widgets.get(key)
+            if w is None:
+                getter = lambda: ""
+            elif key == "request_date":
+                getter = lambda w=w: w.dateTime().toString("yyyy-MM-dd")
             elif isinstance(w, QDateTimeEdit):
-                return w.dateTime().toString("yyyy-MM-dd HH:mm")
+                getter = lambda w=w: w.dateTime().toString("yyyy-MM-dd HH:mm")
             elif isinstance(w, QComboBox):
-                return w.currentText()
+                getter = w.currentText
             elif isinstance(w, QLabel):
-                return os.path.basename(getattr(w, 'path', ''))
+                getter = lambda w=w: os.path.basename(getattr(w, 'path', ''))
             else:
-                return w.text()
-
-        # Main fields
-        for _, key in FormBuilder.TOP_FIELDS + FormBuilder.BOTTOM_FIELDS:
-            values[key] = get_val(key)
-
-        # Test pairs
-        for inp, res, _, _ in TEST_PAIRS:
-            values[inp] = get_val(inp)
-            values[res] = get_val(res)
-
-        # Additional fields
-        for key in ["log_link", "note", "plan_start", "plan_end", "actual_start", "actual_end"]:
-            values[key] = get_val(key)
+                getter = w.text
+            self._getters.append((key, getter))
 
+    def _collect_form_values(self) -> dict:
+        """Thu thập giá trị từ form"""
+        values = {key: getter() for key, getter in self._getters}
         values["dri"] = self.user_info.get('name', '')
         return values
 
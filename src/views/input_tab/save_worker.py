@@ -0,0 +1,49 @@
+"""
+kRel - Input Tab Save Worker
+Copy log file + INSERT request trên thread pool, trả kết quả về GUI thread qua signal
+"""
+from PyQt6.QtCore import QObject, QRunnable, pyqtSignal
+
+from src.services.database import get_db
+from src.services.logger import get_logger
+
+logger = get_logger("input_tab")
+
+
+class SaveSignals(QObject):
+    """Signals for SaveRequestWorker (delivered on the GUI thread)"""
+    finished = pyqtSignal(bool, str)  # success, message
+
+
+class SaveRequestWorker(QRunnable):
+    """Copy the selected log file and insert the request on a worker thread"""
+
+    def __init__(self, controller, values: dict, user_name: str, log_source: str = None):
+        super().__init__()
+        self.controller = controller
+        self.values = values
+        self.user_name = user_name
+        self.log_source = log_source
+        self.signals = SaveSignals()
+
+    def run(self):
+        conn = None
+        try:
+            if self.log_source:
+                self.controller.copy_log_file(
+                    self.log_source, self.values.get("request_no", "Unknown")
+                )
+
+            # Own connection - pyodbc connections are not thread-safe
+            conn = get_db().open_connection()
+            success, msg = self.controller.save(self.values, self.user_name, conn=conn)
+            self.signals.finished.emit(success, msg)
+        except Exception as e:
+            logger.error(f"Save error: {e}", exc_info=True)
+            self.signals.finished.emit(False, str(e))
+        finally:
+            if conn is not None:
+                try:
+                    conn.close()
+                except Exception:
+                    pass
@@ -6,20 +6,101 @@ from PyQt6.QtWidgets import (
     QWidget, QHBoxLayout, QVBoxLayout, QFrame, QLabel,
     QLineEdit, QComboBox, QPushButton, QTableView, QHeaderView
 )
-from PyQt6.QtCore import Qt
-from PyQt6.QtGui import QStandardItemModel, QStandardItem, QColor
+from PyQt6.QtCore import Qt, QAbstractTableModel, QModelIndex
+from PyQt6.QtGui import QColor
 
-from src.styles import BTN_STYLE_BLUE, BTN_STYLE_GREEN, BTN_STYLE_RED, BTN_STYLE_ORANGE, TABLE_STYLE
+from src.styles import TABLE_STYLE, style_button
 
-# Result text colors
+# Result text colors (QColor built once, shared by every cell)
 RESULT_TEXT_COLORS = {
-    "Pass": "#2E7D32",    # Green
-    "Fail": "#C62828",    # Red
-    "Waiver": "#F57C00",  # Orange
-    "-": "#757575"        # Gray
+    "Pass": QColor("#2E7D32"),    # Green
+    "Fail": QColor("#C62828"),    # Red
+    "Waiver": QColor("#F57C00"),  # Orange
+    "-": QColor("#757575")        # Gray
 }
 
 
+class RecentRequestsModel(QAbstractTableModel):
+    """Model nhẹ cho bảng yêu cầu - giữ nguyên rows từ DB, chỉ tạo text cho ô được vẽ"""
+
+    def __init__(self, headers: list, fetch_more=None, parent=None):
+        """fetch_more: callback nạp trang tiếp theo và gọi append_rows()"""
+        super().__init__(parent)
+        self._headers = list(headers)
+        self._rows = []
+        self._fetch_more = fetch_more
+        self._has_more = False
+
+    def set_rows(self, rows: list, has_more: bool = False):
+        """Thay toàn bộ dữ liệu (rows: tuple từ DB, không có cột STT)"""
+        self.beginResetModel()
+        self._rows = list(rows)
+        self._has_more = has_more
+        self.endResetModel()
+
+    def append_rows(self, rows: list, has_more: bool = False):
+        """Thêm trang tiếp theo vào cuối"""
+        self._has_more = has_more
+        if not rows:
+            return
+        first = len(self._rows)
+        self.beginInsertRows(QModelIndex(), first, first + len(rows) - 1)
+        self._rows.extend(rows)
+        self.endInsertRows()
+
+    @property
+    def has_more(self) -> bool:
+        """Còn trang chưa nạp"""
+        return self._has_more
+
+    def raw_row(self, row: int) -> tuple:
+        """Row gốc từ DB"""
+        return self._rows[row]
+
+    def canFetchMore(self, parent=QModelIndex()) -> bool:
+        return not parent.isValid() and self._has_more and self._fetch_more is not None
+
+    def fetchMore(self, parent=QModelIndex()):
+        if self.canFetchMore(parent):
+            self._has_more = False  # set again by append_rows()
+            self._fetch_more()
+
+    def value(self, row: int, col: int) -> str:
+        """Text của ô (cột 0 là STT)"""
+        if col == 0:
+            return str(row + 1)
+        v = self._rows[row][col - 1]
+        return str(v) if v else ""
+
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._headers)
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if role == Qt.ItemDataRole.DisplayRole and orientation == Qt.Orientation.Horizontal:
+            return self._headers[section] if section < len(self._headers) else None
+        return None
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        col = index.column()
+
+        if role == Qt.ItemDataRole.DisplayRole:
+            return self.value(index.row(), col)
+
+        if role == Qt.ItemDataRole.TextAlignmentRole and col == 0:
+            return Qt.AlignmentFlag.AlignCenter
+
+        # KQ Cuối (cột cuối) tô màu theo kết quả
+        if role == Qt.ItemDataRole.ForegroundRole and col == len(self._headers) - 1:
+            return RESULT_TEXT_COLORS.get(self.value(index.row(), col))
+
+        return None
+
+
 class TableSection:
     """Helper class để tạo phần bảng và toolbar với giao diện đẹp"""
 
@@ -29,6 +110,15 @@ class TableSection:
         "Trạng Thái", "DRI", "KQ Cuối"
     ]
 
+    # Độ rộng cột cố định (không đo nội dung mỗi lần reload); "Tên TB" co giãn
+    COL_WIDTHS = (
+        45, 110, 90, 100, 80, 90, 80,
+        90, 160, 110, 110, 110, 110, 110,
+        90, 90, 70
+    )
+    STRETCH_COL = 8  # Tên TB
+    ROW_HEIGHT = 32
+
     # Map search field index to column index (shifted +1 for STT)
     SEARCH_FIELD_MAP = {
         0: None,  # Tất cả
@@ -53,9 +143,11 @@ class TableSection:
         }
     """
 
-    def __init__(self, parent: QWidget):
+    def __init__(self, parent: QWidget, fetch_more=None):
         self.parent = parent
         self.table = None
+        self.model = None
+        self._fetch_more = fetch_more
         self.cb_filter = None
         self.cb_search_field = None
         self.txt_search = None
@@ -145,7 +237,7 @@ class TableSection:
         if on_edit:
             btn_edit = QPushButton("✏️ Sửa")
             btn_edit.setCursor(Qt.CursorShape.PointingHandCursor)
-            btn_edit.setStyleSheet(BTN_STYLE_ORANGE)
+            style_button(btn_edit, "Orange")
             btn_edit.setToolTip("Sửa bản ghi đã chọn")
             btn_edit.clicked.connect(on_edit)
             layout.addWidget(btn_edit)
@@ -153,7 +245,7 @@ class TableSection:
         if on_delete:
             btn_delete = QPushButton("🗑️ Xóa")
             btn_delete.setCursor(Qt.CursorShape.PointingHandCursor)
-            btn_delete.setStyleSheet(BTN_STYLE_RED)
+            style_button(btn_delete, "Red")
             btn_delete.setToolTip("Xóa bản ghi đã chọn")
             btn_delete.clicked.connect(on_delete)
             layout.addWidget(btn_delete)
@@ -164,21 +256,21 @@ class TableSection:
         # Import/Export buttons with better styling
         btn_template = QPushButton("📄 Mẫu")
         btn_template.setCursor(Qt.CursorShape.PointingHandCursor)
-        btn_template.setStyleSheet(BTN_STYLE_BLUE)
+        style_button(btn_template, "Blue")
         btn_template.setToolTip("Tải file mẫu CSV")
         btn_template.clicked.connect(on_template)
         layout.addWidget(btn_template)
 
         btn_import = QPushButton("📥 Nhập")
         btn_import.setCursor(Qt.CursorShape.PointingHandCursor)
-        btn_import.setStyleSheet(BTN_STYLE_GREEN)
+        style_button(btn_import, "Green")
         btn_import.setToolTip("Nhập dữ liệu từ CSV")
         btn_import.clicked.connect(on_import)
         layout.addWidget(btn_import)
 
         btn_export = QPushButton("📤 Xuất")
         btn_export.setCursor(Qt.CursorShape.PointingHandCursor)
-        btn_export.setStyleSheet(BTN_STYLE_BLUE)
+        style_button(btn_export, "Blue")
         btn_export.setToolTip("Xuất dữ liệu ra CSV")
         btn_export.clicked.connect(on_export)
         layout.addWidget(btn_export)
@@ -205,45 +297,39 @@ class TableSection:
         self.table.verticalHeader().hide()
         self.table.setSelectionBehavior(QTableView.SelectionBehavior.SelectRows)
         self.table.setSelectionMode(QTableView.SelectionMode.ExtendedSelection)
+        # Hàng cao cố định, không xuống dòng - view chỉ vẽ các hàng đang hiện
+        self.table.verticalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
+        self.table.verticalHeader().setDefaultSectionSize(self.ROW_HEIGHT)
+        self.table.setWordWrap(False)
+        self.table.setTextElideMode(Qt.TextElideMode.ElideRight)
+
+        # Model tạo một lần; mỗi lần reload chỉ thay rows
+        self.model = RecentRequestsModel(self.TABLE_HEADERS, self._fetch_more, self.table)
+        self.table.setModel(self.model)
+        self._setup_column_widths()
 
         table_layout.addWidget(self.table)
         parent_layout.addWidget(table_frame, stretch=2)
         return self.table
 
-    def update_table(self, rows: list):
+    def update_table(self, rows: list, has_more: bool = False):
         """Cập nhật dữ liệu bảng"""
-        model = QStandardItemModel()
-        model.setHorizontalHeaderLabels(self.TABLE_HEADERS)
-
-        for idx, row in enumerate(rows, start=1):
-            stt_item = QStandardItem(str(idx))
-            stt_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-
-            items = [stt_item]
-            for i, v in enumerate(row):
-                val = str(v) if v else ""
-                item = QStandardItem(val)
-
-                # KQ Cuối column (index 16 in row, which is last column)
-                if i == len(row) - 1 and val in RESULT_TEXT_COLORS:
-                    item.setForeground(QColor(RESULT_TEXT_COLORS[val]))
-
-                items.append(item)
-
-            model.appendRow(items)
-
-        self.table.setModel(model)
+        self.model.set_rows(rows, has_more)
 
+    def append_rows(self, rows: list, has_more: bool = False):
+        """Thêm trang tiếp theo (khi cuộn xuống cuối bảng)"""
+        self.model.append_rows(rows, has_more)
+    def _setup_column_widths(self):
+        """Đặt độ rộng cột một lần (Interactive, không ResizeToContents)"""
         header = self.table.horizontalHeader()
-        header.setSectionResizeMode(QHeaderView.ResizeMode.ResizeToContents)
-        header.setSectionResizeMode(8, QHeaderView.ResizeMode.Stretch)
-
-        # Set STT column width
-        self.table.setColumnWidth(0, 45)
+        header.setSectionResizeMode(QHeaderView.ResizeMode.Interactive)
+        for col, width in enumerate(self.COL_WIDTHS):
+            header.resizeSection(col, width)
+        header.setSectionResizeMode(self.STRETCH_COL, QHeaderView.ResizeMode.Stretch)
 
     def filter_table(self, search_text: str):
         """Lọc bảng theo từ khóa"""
-        model = self.table.model()
+        model = self.model
         if not model:
             return
 
@@ -257,15 +343,12 @@ class TableSection:
             if target_col is None:
                 # Search all columns
                 for col in range(model.columnCount()):
-                    item = model.item(row, col)
-                    if item and text in item.text().lower():
+                    if text in model.value(row, col).lower():
                         match = True
                         break
             else:
                 # Search specific column
-                item = model.item(row, target_col)
-                if item and text in item.text().lower():
-                    match = True
+                match = text in model.value(row, target_col).lower()
 
             self.table.setRowHidden(row, not match)
 
@@ -276,7 +359,7 @@ class TableSection:
     def get_selected_request_nos(self) -> list:
         """Lấy danh sách request_no đã chọn"""
         selected = []
-        model = self.table.model()
+        model = self.model
         if not model:
             return selected
 
@@ -287,9 +370,9 @@ class TableSection:
         for index in selection.selectedRows():
             row = index.row()
             # Cột 1 là Mã YC (sau cột STT)
-            item = model.item(row, 1)
-            if item:
-                selected.append(item.text())
+            request_no = model.value(row, 1)
+            if request_no:
+                selected.append(request_no)
 
         return selected
 
@@ -9,7 +9,7 @@ from PyQt6.QtWidgets import (
 from PyQt6.QtCore import Qt
 from PyQt6.QtGui import QPalette, QColor
 
-from src.styles import LOGIN_STYLE, BTN_STYLE_BLUE
+from src.styles import LOGIN_STYLE, style_button
 from src.services.auth import get_auth
 from src.services.validator import UserValidator
 from src.views.register_dialog import RegisterDialog
@@ -83,7 +83,7 @@ class LoginDialog(QDialog):
         btn_login = QPushButton("ĐĂNG NHẬP")
         btn_login.setFixedHeight(48)
         btn_login.setCursor(Qt.CursorShape.PointingHandCursor)
-        btn_login.setStyleSheet(BTN_STYLE_BLUE)
+        style_button(btn_login, "Blue")
         btn_login.clicked.connect(self._do_login)
         layout.addWidget(btn_login)
 
@@ -19,7 +19,7 @@ from PyQt6.QtCore import Qt
 from PyQt6.QtGui import QIcon
 
 from src.config import APP_TITLE, DEFAULT_LOG_PATH, CONFIG_FILE
-from src.styles import BTN_STYLE_RED, TAB_STYLE, TOOLBAR_STYLE
+from src.styles import TAB_STYLE, TOOLBAR_STYLE, style_button
 
 # Module logger
 logger = logging.getLogger("kRel.main_window")
@@ -154,7 +154,7 @@ class MainWindow(QMainWindow):
         # Logout button
         btn_logout = QPushButton("Đăng xuất")
         btn_logout.setCursor(Qt.CursorShape.PointingHandCursor)
-        btn_logout.setStyleSheet(BTN_STYLE_RED)
+        style_button(btn_logout, "Red")
         btn_logout.clicked.connect(self._logout)
         toolbar.addWidget(btn_logout)
     
@@ -8,7 +8,7 @@ from PyQt6.QtWidgets import (
 from PyQt6.QtCore import Qt
 from PyQt6.QtGui import QPalette, QColor
 
-from src.styles import LOGIN_STYLE, BTN_STYLE_BLUE
+from src.styles import LOGIN_STYLE, style_button
 from src.services.auth import get_auth
 from src.services.validator import UserValidator
 
@@ -72,7 +72,7 @@ class RegisterDialog(QDialog):
         btn_register = QPushButton("ĐĂNG KÝ NGAY")
         btn_register.setFixedHeight(48)
         btn_register.setCursor(Qt.CursorShape.PointingHandCursor)
-        btn_register.setStyleSheet(BTN_STYLE_BLUE)
+        style_button(btn_register, "Blue")
         btn_register.clicked.connect(self._do_register)
         layout.addWidget(btn_register)
 
@@ -52,7 +52,6 @@ class GanttRenderer:
         view_start = pd.Timestamp(date_start)
         view_end = pd.Timestamp(date_end)
         
-        equip_list = sorted(df['equip_no'].unique())
         total_days = (view_end - view_start).days + 1
         scene_width = self.START_X + total_days * self.DAY_W + 50
         
@@ -62,9 +61,9 @@ class GanttRenderer:
         # Draw date headers
         self._draw_date_headers(view_start, total_days, today_ts)
         
-        # Draw equipment rows
-        for eq_code in equip_list:
-            sub_df = df[df['equip_no'] == eq_code].sort_values('start_dt')
+        # Draw equipment rows (one groupby pass instead of a filter per equipment)
+        by_equip = df.sort_values('start_dt').groupby('equip_no', sort=True)
+        for eq_code, sub_df in by_equip:
             row_height = self._draw_equipment_row(
                 eq_code, sub_df, current_y, view_start, view_end, scene_width
             )
@@ -124,7 +123,8 @@ class GanttRenderer:
         lanes = []
         test_placements = []
         
-        for _, row in sub_df.iterrows():
+        # Plain dicts per row (row['col'] / row.get work as before, no Series per row)
+        for row in sub_df.to_dict("records"):
             real_s = row['start_dt']
             real_e = row['end_dt'] if pd.notna(row['end_dt']) else real_s
             
@@ -2,7 +2,7 @@
 kRel - Report Tab (Refactored)
 Tab báo cáo với báo cáo chi tiết và Gantt chart
 """
-import pandas as pd
+import csv
 
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QFrame,
@@ -10,7 +10,7 @@ from PyQt6.QtWidgets import (
     QDateEdit, QTableView, QFileDialog, QMessageBox, QHeaderView,
     QGraphicsScene, QGraphicsView
 )
-from PyQt6.QtCore import Qt, QDate
+from PyQt6.QtCore import Qt, QDate, QSignalBlocker
 from PyQt6.QtGui import QStandardItemModel, QStandardItem, QPainter, QColor, QBrush, QFont
 
 from src.services.database import get_db
@@ -18,13 +18,19 @@ from src.services.data_event_bus import get_event_bus
 from src.services.logger import get_logger
 from src.widgets.loading_overlay import LoadingMixin
 from src.styles import (
-    BTN_STYLE_BLUE, BTN_STYLE_ORANGE, TABLE_STYLE,
-    TOOLBAR_BLUE_STYLE, INFO_LABEL_STYLE, TAB_STYLE
+    TABLE_STYLE, TOOLBAR_BLUE_STYLE, INFO_LABEL_STYLE, TAB_STYLE, style_button
 )
 from src.views.report_tab.gantt_renderer import GanttRenderer
 
 logger = get_logger("report_tab")
 
+# KQ Cuối text colors (shared brushes, never created per cell)
+FINAL_RES_BRUSHES = {
+    "pass": QBrush(QColor("#1976D2")),
+    "fail": QBrush(QColor("#D32F2F")),
+    "waiver": QBrush(QColor("#F57F17")),
+}
+
 
 class ReportTab(QWidget, LoadingMixin):
     """Report tab with detail reports and Gantt chart"""
@@ -100,13 +106,13 @@ class ReportTab(QWidget, LoadingMixin):
         # Buttons
         btn_view = QPushButton("🔍 Xem")
         btn_view.setCursor(Qt.CursorShape.PointingHandCursor)
-        btn_view.setStyleSheet(BTN_STYLE_BLUE)
+        style_button(btn_view, "Blue")
         btn_view.clicked.connect(self._load_report_1)
         fl.addWidget(btn_view)
 
         btn_export = QPushButton("📤 Xuất CSV")
         btn_export.setCursor(Qt.CursorShape.PointingHandCursor)
-        btn_export.setStyleSheet(BTN_STYLE_ORANGE)
+        style_button(btn_export, "Orange")
         btn_export.clicked.connect(lambda: self._export_csv(self.r1_table, "BaoCao_ChiTiet"))
         fl.addWidget(btn_export)
 
@@ -174,7 +180,7 @@ class ReportTab(QWidget, LoadingMixin):
         btn_view = QPushButton("🔍 Xem")
         btn_view.setCursor(Qt.CursorShape.PointingHandCursor)
         btn_view.setMinimumWidth(110)
-        btn_view.setStyleSheet(BTN_STYLE_BLUE)
+        style_button(btn_view, "Blue")
         btn_view.clicked.connect(self._draw_gantt)
         fl.addWidget(btn_view)
 
@@ -270,13 +276,11 @@ class ReportTab(QWidget, LoadingMixin):
 
             # Update combo
             current = self.r2_equip.currentText()
-            self.r2_equip.blockSignals(True)
-            self.r2_equip.clear()
-            self.r2_equip.addItem("Tất cả Thiết Bị")
-            for code in self.equip_map:
-                self.r2_equip.addItem(code)
-            self.r2_equip.setCurrentText(current)
-            self.r2_equip.blockSignals(False)
+            with QSignalBlocker(self.r2_equip):
+                self.r2_equip.clear()
+                self.r2_equip.addItem("Tất cả Thiết Bị")
+                self.r2_equip.addItems(list(self.equip_map))
+                self.r2_equip.setCurrentText(current)
 
             # Update gantt renderer
             if hasattr(self, 'gantt_renderer'):
@@ -341,24 +345,25 @@ class ReportTab(QWidget, LoadingMixin):
     def _fill_table(self, table_view, sql, params, headers):
         """Fill table with query results"""
         try:
-            conn = self.db.connect()
-            df = pd.read_sql_query(sql, conn, params=tuple(params))
+            # Plain cursor tuples - no DataFrame just to fill a table
+            rows = self.db.fetch_all(sql, tuple(params))
 
-            model = QStandardItemModel()
+            # Preallocated rows filled with setItem (no rowsInserted per appendRow)
+            model = QStandardItemModel(len(rows), len(headers))
             model.setHorizontalHeaderLabels(headers)
 
             # Check if headers include STT column
             has_stt = "STT" in headers
             col_final_idx = headers.index("KQ Cuối") if "KQ Cuối" in headers else -1
+            final_font = QFont("Arial", 9)
+            final_font.setBold(True)
 
-            for row_idx, (_, row) in enumerate(df.iterrows(), start=1):
-                items = []
-
+            for r, row in enumerate(rows):
                 # Add STT column if headers include it
                 if has_stt:
-                    stt_item = QStandardItem(str(row_idx))
+                    stt_item = QStandardItem(str(r + 1))
                     stt_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-                    items.append(stt_item)
+                    model.setItem(r, 0, stt_item)
 
                 for i, x in enumerate(row):
                     val = str(x) if x is not None else ""
@@ -367,32 +372,26 @@ class ReportTab(QWidget, LoadingMixin):
                     # Adjust index for KQ Cuối when STT is present
                     actual_col_idx = i + 1 if has_stt else i
                     if actual_col_idx == col_final_idx:
-                        font = QFont("Arial", 9)
-                        font.setBold(True)
-                        item.setFont(font)
+                        item.setFont(final_font)
+                        brush = FINAL_RES_BRUSHES.get(val.lower().strip())
+                        if brush is not None:
+                            item.setForeground(brush)
 
-                        v_lower = val.lower().strip()
-                        if v_lower == "pass":
-                            item.setForeground(QBrush(QColor("#1976D2")))
-                        elif v_lower == "fail":
-                            item.setForeground(QBrush(QColor("#D32F2F")))
-                        elif v_lower == "waiver":
-                            item.setForeground(QBrush(QColor("#F57F17")))
-
-                    items.append(item)
-                model.appendRow(items)
+                    model.setItem(r, actual_col_idx, item)
 
             table_view.setModel(model)
             header = table_view.horizontalHeader()
             header.setSectionResizeMode(QHeaderView.ResizeMode.ResizeToContents)
+            # Fit widths from a sample of rows, not every cell
+            header.setResizeContentsPrecision(50)
 
             # Set STT column width if present
             if has_stt:
                 header.setSectionResizeMode(0, QHeaderView.ResizeMode.Fixed)
                 table_view.setColumnWidth(0, 50)
 
-            if not df.empty:
-                QMessageBox.information(self, "OK", f"Đã tải {len(df)} dòng.")
+            if rows:
+                QMessageBox.information(self, "OK", f"Đã tải {len(rows)} dòng.")
             else:
                 QMessageBox.information(self, "Info", "Không có dữ liệu!")
 
@@ -418,9 +417,10 @@ class ReportTab(QWidget, LoadingMixin):
                 model.headerData(i, Qt.Orientation.Horizontal)
                 for i in range(model.columnCount())
             ]
-            pd.DataFrame(data, columns=headers).to_csv(
-                path, index=False, encoding='utf-8-sig'
-            )
+            with open(path, "w", newline="", encoding="utf-8-sig") as f:
+                writer = csv.writer(f)
+                writer.writerow(headers)
+                writer.writerows(data)
             QMessageBox.information(self, "OK", "Đã xuất file!")
 
     def _draw_gantt(self):
@@ -18,10 +18,7 @@ import pandas as pd
 from src.config import CONFIG_FILE
 from src.services.database import get_db
 from src.services.encryption import EncryptionService
-from src.styles import (
-    BTN_STYLE_BLUE, BTN_STYLE_GREEN, BTN_STYLE_RED,
-    BTN_STYLE_ORANGE, BTN_STYLE_GREEN_SOLID
-)
+from src.styles import style_button
 
 
 class ConfigPage(QWidget):
@@ -83,7 +80,7 @@ class ConfigPage(QWidget):
 
         btn_log = QPushButton("📁")
         btn_log.setFixedWidth(50)
-        btn_log.setStyleSheet(BTN_STYLE_BLUE)
+        style_button(btn_log, "Blue")
         btn_log.setCursor(Qt.CursorShape.PointingHandCursor)
         btn_log.clicked.connect(lambda: self._pick_folder(self.log_txt))
 
@@ -103,13 +100,13 @@ class ConfigPage(QWidget):
 
         # Buttons
         btn_test = QPushButton("  🔗 Test Kết Nối")
-        btn_test.setStyleSheet(BTN_STYLE_ORANGE)
+        style_button(btn_test, "Orange")
         btn_test.setFixedWidth(160)
         btn_test.setCursor(Qt.CursorShape.PointingHandCursor)
         btn_test.clicked.connect(self._test_connection)
 
         btn_save = QPushButton("  💾 Lưu Cấu Hình")
-        btn_save.setStyleSheet(BTN_STYLE_GREEN_SOLID)
+        style_button(btn_save, "GreenSolid")
         btn_save.setFixedWidth(160)
         btn_save.setCursor(Qt.CursorShape.PointingHandCursor)
         btn_save.clicked.connect(self._save_config)
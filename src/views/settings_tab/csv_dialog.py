@@ -72,7 +72,7 @@ class CsvDialog(QDialog):
 
                 with self.db.get_cursor() as cursor:
                     if self.table == "equipment":
-                        data = [tuple(str(x) for x in r[:10]) for _, r in df.iterrows()]
+                        data = [tuple(str(x) for x in r[:10]) for r in df.itertuples(index=False, name=None)]
                         for row in data:
                             cursor.execute(
                                 "IF NOT EXISTS (SELECT 1 FROM equipment WHERE control_no=?) "
@@ -82,8 +82,8 @@ class CsvDialog(QDialog):
                         get_event_bus().emit_equipment_changed()
                     else:
                         data = [
-                            (str(r.iloc[0]),) for _, r in df.iterrows()
-                            if str(r.iloc[0]).strip()
+                            (str(r[0]),) for r in df.itertuples(index=False, name=None)
+                            if str(r[0]).strip()
                         ]
                         for row in data:
                             cursor.execute(
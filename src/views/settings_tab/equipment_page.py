@@ -9,14 +9,11 @@ from PyQt6.QtWidgets import (
 )
 from PyQt6.QtCore import Qt
 from PyQt6.QtGui import QStandardItemModel, QStandardItem
-import pandas as pd
 
 from src.services.database import get_db
 from src.services.data_event_bus import get_event_bus
 from src.services.logger import get_logger
-from src.styles import (
-    BTN_STYLE_BLUE, BTN_STYLE_GREEN, BTN_STYLE_RED, BTN_STYLE_ORANGE, TABLE_STYLE
-)
+from src.styles import TABLE_STYLE, style_button
 from src.views.settings_tab.csv_dialog import CsvDialog, EQUIP_HEADERS
 
 logger = get_logger("equipment_page")
@@ -57,22 +54,22 @@ class EquipmentPage(QWidget):
 
         # Buttons
         btn_add = QPushButton("➕ Thêm Mới")
-        btn_add.setStyleSheet(BTN_STYLE_BLUE)
+        style_button(btn_add, "Blue")
         btn_add.setCursor(Qt.CursorShape.PointingHandCursor)
         btn_add.clicked.connect(self._add)
 
         btn_edit = QPushButton("✏️ Sửa")
-        btn_edit.setStyleSheet(BTN_STYLE_GREEN)
+        style_button(btn_edit, "Green")
         btn_edit.setCursor(Qt.CursorShape.PointingHandCursor)
         btn_edit.clicked.connect(self._edit)
 
         btn_del = QPushButton("🗑️ Xóa")
-        btn_del.setStyleSheet(BTN_STYLE_RED)
+        style_button(btn_del, "Red")
         btn_del.setCursor(Qt.CursorShape.PointingHandCursor)
         btn_del.clicked.connect(self._delete)
 
         btn_csv = QPushButton("📤 CSV")
-        btn_csv.setStyleSheet(BTN_STYLE_ORANGE)
+        style_button(btn_csv, "Orange")
         btn_csv.setCursor(Qt.CursorShape.PointingHandCursor)
         btn_csv.clicked.connect(self._csv_dialog)
 
@@ -92,23 +89,23 @@ class EquipmentPage(QWidget):
         layout.addWidget(self.table)
 
     def _load(self, table=None):
-        conn = self.db.connect()
-        df = pd.read_sql("SELECT * FROM equipment ORDER BY control_no", conn)
+        rows = self.db.fetch_all("SELECT * FROM equipment ORDER BY control_no")
 
-        model = QStandardItemModel()
+        model = QStandardItemModel(len(rows), len(EQUIP_HEADERS))
         model.setHorizontalHeaderLabels(EQUIP_HEADERS)
 
-        for _, row in df.iterrows():
-            items = []
-            for x in row:
-                items.append(QStandardItem(str(x) if x else ""))
-            if len(items) > 1:
-                items[1].setData(str(row.iloc[1]), Qt.ItemDataRole.UserRole)
-            model.appendRow(items)
+        for r, row in enumerate(rows):
+            for c, x in enumerate(row):
+                item = QStandardItem(str(x) if x else "")
+                if c == 1:
+                    item.setData(str(x), Qt.ItemDataRole.UserRole)
+                model.setItem(r, c, item)
 
         self.table.setModel(model)
         h = self.table.horizontalHeader()
         h.setSectionResizeMode(QHeaderView.ResizeMode.ResizeToContents)
+        # Fit widths from a sample of rows, not every cell
+        h.setResizeContentsPrecision(50)
         h.setSectionResizeMode(3, QHeaderView.ResizeMode.Stretch)
         h.setSectionResizeMode(9, QHeaderView.ResizeMode.Stretch)
 
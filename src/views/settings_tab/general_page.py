@@ -9,14 +9,11 @@ from PyQt6.QtWidgets import (
 )
 from PyQt6.QtCore import Qt
 from PyQt6.QtGui import QStandardItemModel, QStandardItem
-import pandas as pd
 
 from src.services.database import get_db
 from src.services.data_event_bus import get_event_bus
 from src.services.logger import get_logger
-from src.styles import (
-    BTN_STYLE_BLUE, BTN_STYLE_GREEN, BTN_STYLE_RED, BTN_STYLE_ORANGE, TABLE_STYLE
-)
+from src.styles import TABLE_STYLE, style_button
 from src.views.settings_tab.csv_dialog import CsvDialog
 
 logger = get_logger("general_page")
@@ -71,23 +68,23 @@ class GeneralDataPage(QWidget):
             btn_add = QPushButton()
             btn_add.setIcon(self.style().standardIcon(QStyle.StandardPixmap.SP_FileIcon))
             btn_add.setToolTip("Thêm")
-            btn_add.setStyleSheet(BTN_STYLE_BLUE)
+            style_button(btn_add, "Blue")
             btn_add.clicked.connect(lambda _, t=table: self._add(t))
 
             btn_edit = QPushButton()
             btn_edit.setIcon(self.style().standardIcon(QStyle.StandardPixmap.SP_FileDialogDetailedView))
             btn_edit.setToolTip("Sửa")
-            btn_edit.setStyleSheet(BTN_STYLE_GREEN)
+            style_button(btn_edit, "Green")
             btn_edit.clicked.connect(lambda _, t=table: self._edit(t))
 
             btn_del = QPushButton()
             btn_del.setIcon(self.style().standardIcon(QStyle.StandardPixmap.SP_TrashIcon))
             btn_del.setToolTip("Xóa")
-            btn_del.setStyleSheet(BTN_STYLE_RED)
+            style_button(btn_del, "Red")
             btn_del.clicked.connect(lambda _, t=table: self._delete(t))
 
             btn_csv = QPushButton("CSV")
-            btn_csv.setStyleSheet(BTN_STYLE_ORANGE)
+            style_button(btn_csv, "Orange")
             btn_csv.clicked.connect(lambda _, t=table: self._csv_dialog(t))
 
             bl.addWidget(btn_add, 0, 0)
@@ -109,10 +106,9 @@ class GeneralDataPage(QWidget):
             layout.addWidget(frame)
 
     def _load(self, table):
-        conn = self.db.connect()
-        df = pd.read_sql(f"SELECT name FROM {table} ORDER BY name", conn)
+        rows = self.db.fetch_all(f"SELECT name FROM {table} ORDER BY name")
 
-        model = QStandardItemModel()
+        model = QStandardItemModel(len(rows), 1)
         header_name = "Giá trị"
         for k, v in self.SIMPLE_TABLES.items():
             if v == table:
@@ -121,10 +117,10 @@ class GeneralDataPage(QWidget):
 
         model.setHorizontalHeaderLabels([header_name])
 
-        for _, row in df.iterrows():
-            item = QStandardItem(str(row.iloc[0]))
-            item.setData(str(row.iloc[0]), Qt.ItemDataRole.UserRole)
-            model.appendRow([item])
+        for r, (name,) in enumerate(rows):
+            item = QStandardItem(str(name))
+            item.setData(str(name), Qt.ItemDataRole.UserRole)
+            model.setItem(r, 0, item)
 
         self.views[table].setModel(model)
         self.views[table].horizontalHeader().setSectionResizeMode(
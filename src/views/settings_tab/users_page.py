@@ -11,10 +11,9 @@ from PyQt6.QtWidgets import (
 )
 from PyQt6.QtCore import Qt
 from PyQt6.QtGui import QStandardItemModel, QStandardItem
-import pandas as pd
 
 from src.services.database import get_db
-from src.styles import BTN_STYLE_BLUE, BTN_STYLE_GREEN, BTN_STYLE_RED, TABLE_STYLE
+from src.styles import TABLE_STYLE, style_button
 
 
 class UsersPage(QWidget):
@@ -79,15 +78,15 @@ class UsersPage(QWidget):
         # Buttons
         hb = QHBoxLayout()
         btn_new = QPushButton("➕ Mới")
-        btn_new.setStyleSheet(BTN_STYLE_BLUE)
+        style_button(btn_new, "Blue")
         btn_new.clicked.connect(self._clear_form)
 
         btn_save = QPushButton("💾 Lưu")
-        btn_save.setStyleSheet(BTN_STYLE_GREEN)
+        style_button(btn_save, "Green")
         btn_save.clicked.connect(self._save_user)
 
         btn_del = QPushButton("🗑️ Xóa")
-        btn_del.setStyleSheet(BTN_STYLE_RED)
+        style_button(btn_del, "Red")
         btn_del.clicked.connect(self._delete_user)
 
         hb.addWidget(btn_new)
@@ -99,14 +98,14 @@ class UsersPage(QWidget):
         layout.addLayout(right, 3)
 
     def _load_users(self):
-        conn = self.db.connect()
-        df = pd.read_sql("SELECT username, fullname, role, email FROM users", conn)
+        rows = self.db.fetch_all("SELECT username, fullname, role, email FROM users")
 
-        model = QStandardItemModel()
+        model = QStandardItemModel(len(rows), 4)
         model.setHorizontalHeaderLabels(["Tài khoản", "Họ Tên", "Vai trò", "Email"])
 
-        for _, row in df.iterrows():
-            model.appendRow([QStandardItem(str(x)) for x in row])
+        for r, row in enumerate(rows):
+            for c, x in enumerate(row):
+                model.setItem(r, c, QStandardItem(str(x)))
 
         self.tbl_users.setModel(model)
         h = self.tbl_users.horizontalHeader()
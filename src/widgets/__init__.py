@@ -5,6 +5,7 @@ Custom UI Widgets
 from src.widgets.gantt_chart import GanttBar, GanttChartView, GanttChartHelper
 from src.widgets.validated_field import ValidatedField
 from src.widgets.loading_overlay import LoadingOverlay, LoadingMixin, LoadingContext
+from src.widgets.lazy_combo import LazyComboBox
 
 __all__ = [
     "GanttBar",
@@ -14,4 +15,5 @@ __all__ = [
     "LoadingOverlay",
     "LoadingMixin",
     "LoadingContext",
+    "LazyComboBox",
 ]
\ No newline at end of file
@@ -0,0 +1,52 @@
+"""
+kRel - Lazy Combo Box
+ComboBox chỉ nạp items khi người dùng thực sự dùng đến
+"""
+from typing import Callable, Optional
+
+from PyQt6.QtWidgets import QComboBox
+
+
+class LazyComboBox(QComboBox):
+    """
+    QComboBox that populates itself on first use (popup, focus or wheel).
+
+    Usage:
+        combo = LazyComboBox()
+        combo.loader = lambda w: w.addItems(["", "A", "B"])
+    """
+
+    def __init__(self, loader: Optional[Callable[["LazyComboBox"], None]] = None, parent=None):
+        super().__init__(parent)
+        self.loader = loader
+        self._loaded = False
+        # Lookup lists are single-line text: the popup sizes one row, not every item
+        self.view().setUniformItemSizes(True)
+
+    @property
+    def is_loaded(self) -> bool:
+        return self._loaded
+
+    def ensure_loaded(self):
+        """Run the loader once"""
+        if self._loaded or self.loader is None:
+            return
+        self._loaded = True
+        self.loader(self)
+
+    def reset_loaded(self):
+        """Load again on next use (e.g. after lookup data changed)"""
+        self._loaded = False
+
+    def showPopup(self):
+        self.ensure_loaded()
+        super().showPopup()
+
+    def focusInEvent(self, event):
+        # Keyboard selection works without opening the popup
+        self.ensure_loaded()
+        super().focusInEvent(event)
+
+    def wheelEvent(self, event):
+        self.ensure_loaded()
+        super().wheelEvent(event)
@@ -171,6 +171,8 @@ class LoadingMixin:
     """
 
     _loading_overlay: LoadingOverlay = None
+    _loading_timer: QTimer = None
+    _deferred_message: str = None
 
     def setup_loading(self, message: str = "Đang tải..."):
         """Initialize loading overlay. Call after UI is set up."""
@@ -185,9 +187,22 @@ class LoadingMixin:
         from PyQt6.QtWidgets import QApplication
         QApplication.processEvents()
 
+    def show_loading_deferred(self, message: str = None, delay_ms: int = 200):
+        """Show loading overlay only if hide_loading() was not called within delay_ms"""
+        if self._loading_timer is None:
+            self._loading_timer = QTimer(self)
+            self._loading_timer.setSingleShot(True)
+            self._loading_timer.timeout.connect(
+                lambda: self.show_loading(self._deferred_message)
+            )
+        self._deferred_message = message
+        self._loading_timer.start(delay_ms)
+
     def hide_loading(self):
-        """Hide loading overlay"""
-        if self._loading_overlay:
+        """Hide loading overlay (and cancel a deferred show)"""
+        if self._loading_timer is not None:
+            self._loading_timer.stop()
+        if self._loading_overlay and not self._loading_overlay.isHidden():
             self._loading_overlay.hide_loading()
 
     def with_loading(self, message: str = "Đang xử lý..."):
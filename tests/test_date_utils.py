@@ -0,0 +1,100 @@
+"""
+Unit tests for Date Utilities
+Tests for date parsing and conversion helpers
+"""
+import pytest
+from datetime import datetime
+from unittest.mock import patch
+
+from PyQt6.QtCore import QDate, QDateTime, QTime
+
+from src.utils import date_utils
+from src.utils.date_utils import (
+    parse_date, days_between, format_for_display, today_string, now_string
+)
+
+
+class TestParseDate:
+    """Tests for parse_date"""
+
+    @pytest.mark.parametrize("value, expected", [
+        ("2024-01-15 08:30:45", datetime(2024, 1, 15, 8, 30, 45)),
+        ("2024-01-15 08:30", datetime(2024, 1, 15, 8, 30)),
+        ("2024-01-15", datetime(2024, 1, 15)),
+        ("15/01/2024 08:30:45", datetime(2024, 1, 15, 8, 30, 45)),
+        ("15/01/2024 08:30", datetime(2024, 1, 15, 8, 30)),
+        ("15/01/2024", datetime(2024, 1, 15)),
+        ("2024-1-5", datetime(2024, 1, 5)),
+        ("  2024-01-15  ", datetime(2024, 1, 15)),
+    ])
+    def test_parse_supported_formats(self, value, expected):
+        """Test that all supported formats are parsed"""
+        assert parse_date(value) == expected
+
+    @pytest.mark.parametrize("value", [
+        "", None, "abc", "2024-13-01", "31/02/2024", "2024/01/15", "2024-01-15 25:00",
+    ])
+    def test_parse_invalid_returns_none(self, value):
+        """Test that invalid input returns None"""
+        assert parse_date(value) is None
+
+
+class TestDateHelpers:
+    """Tests for helpers built on parse_date"""
+
+    def test_days_between(self):
+        """Test day difference between two dates"""
+        assert days_between("2024-01-01", "2024-01-31") == 30
+        assert days_between("", "2024-01-31") == 0
+
+    def test_format_for_display(self):
+        """Test DD/MM/YYYY display formatting"""
+        assert format_for_display("2024-01-15 08:30") == "15/01/2024"
+        assert format_for_display("invalid") == "invalid"
+
+    def test_parse_date_is_cached(self):
+        """Test that repeated inputs are served from cache"""
+        parse_date.cache_clear()
+        first = parse_date("2024-02-29")
+        assert parse_date("2024-02-29") is first
+        assert parse_date.cache_info().hits == 1
+
+
+class TestNowStrings:
+    """Tests for today_string / now_string"""
+
+    def test_today_string_format(self):
+        """Test that today_string matches datetime.now()"""
+        assert today_string() == datetime.now().strftime("%Y-%m-%d")
+
+    def test_now_string_reused_within_same_second(self):
+        """Test that repeated calls in the same second share one string"""
+        with patch("src.utils.date_utils.time.time", return_value=1700000000.5):
+            assert now_string("%H:%M:%S") is now_string("%H:%M:%S")
+
+    def test_now_string_refreshes_on_next_second(self):
+        """Test that a new second produces a fresh value"""
+        with patch("src.utils.date_utils.time.time", return_value=1700000000.0):
+            now_string()
+        with patch("src.utils.date_utils.time.time", return_value=1700000001.0):
+            now_string()
+        assert all(key[0] == 1700000001 for key in date_utils._NOW_CACHE)
+
+
+class TestQtConversion:
+    """Tests for to_qdate / to_qdatetime"""
+
+    @pytest.mark.parametrize("value", ["2024-01-15", "15/01/2024", "2024-1-15", "2024-01-15 08:30"])
+    def test_to_qdate(self, value):
+        """Test that native and fallback formats give the same QDate"""
+        assert date_utils.to_qdate(value) == QDate(2024, 1, 15)
+
+    @pytest.mark.parametrize("value", ["2024-01-15 08:30:45", "15/01/2024 08:30:45"])
+    def test_to_qdatetime_keeps_time(self, value):
+        """Test that the time part is preserved"""
+        assert date_utils.to_qdatetime(value) == QDateTime(QDate(2024, 1, 15), QTime(8, 30, 45))
+
+    def test_invalid_falls_back_to_current(self):
+        """Test that invalid input returns the current date"""
+        assert date_utils.to_qdate("") == QDate.currentDate()
+        assert date_utils.to_qdatetime("abc").isValid()
@@ -0,0 +1,80 @@
+"""
+Unit tests for Edit tab delegates
+Tests that the cached-text fast path paints like the styled delegate
+"""
+import os
+
+import pytest
+from PyQt6.QtCore import Qt
+from PyQt6.QtGui import QStandardItemModel, QStandardItem
+from PyQt6.QtWidgets import QApplication, QTableView
+
+from src.views.edit_tab.delegates import DateDelegate, NoEditDelegate
+
+TEXT = "2024-01-02 03:04:05"
+
+# Same item rules as the Edit tab table
+TABLE_QSS = """
+    QTableView { background-color: white; font-size: 13px; color: #212121; }
+    QTableView::item { padding: 6px 8px; border-bottom: 1px solid #E3F2FD; }
+"""
+
+
+@pytest.fixture(scope="module")
+def qapp():
+    """QApplication for widget tests (offscreen unless a platform is set)"""
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    return QApplication.instance() or QApplication([])
+
+
+def render_cells(qapp, delegate_cls):
+    """Paint TEXT in column 0 with delegate_cls and in column 1 with the styled delegate"""
+    view = QTableView()
+    view.setStyleSheet(TABLE_QSS)
+    view.setFocusPolicy(Qt.FocusPolicy.NoFocus)
+    model = QStandardItemModel(1, 2, view)
+    for col in range(2):
+        model.setItem(0, col, QStandardItem(TEXT))
+    view.setModel(model)
+    view.resize(600, 100)
+    for col in range(2):
+        view.setColumnWidth(col, 220)
+    delegate = delegate_cls(view)
+    view.setItemDelegateForColumn(0, delegate)
+    view.show()
+    qapp.processEvents()
+
+    image = view.viewport().grab().toImage()
+    cells = [image.copy(view.visualRect(model.index(0, col))) for col in range(2)]
+    view.close()
+    return delegate, cells
+
+
+class TestDateDelegate:
+    """Tests for DateDelegate"""
+
+    def test_fast_path_matches_styled_cell(self, qapp):
+        """Test that cached text lands in the styled text rect and keeps the item border"""
+        delegate, (fast, styled) = render_cells(qapp, DateDelegate)
+        assert TEXT in delegate._static  # drawn through the QStaticText path
+        assert fast == styled
+
+    def test_clear_cache(self, qapp):
+        """Test that clear_cache drops prepared texts"""
+        delegate, _ = render_cells(qapp, DateDelegate)
+        delegate.clear_cache()
+        assert delegate._static == {}
+
+
+class TestNoEditDelegate:
+    """Tests for NoEditDelegate"""
+
+    def test_fast_path_matches_styled_cell(self, qapp):
+        """Test that read-only cells follow the QSS item padding and border"""
+        delegate, (fast, styled) = render_cells(qapp, NoEditDelegate)
+        assert TEXT in delegate._static
+        assert fast == styled
+
+    def test_no_editor(self):
+        """Test that no editor is created"""
+        assert NoEditDelegate().createEditor(None, None, None) is None
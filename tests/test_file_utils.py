@@ -0,0 +1,87 @@
+"""
+Unit tests for File Utilities
+Tests for CSV helpers, filename cleaning and file copy
+"""
+import pytest
+
+from src.utils.file_utils import (
+    iter_csv, read_csv, write_csv, get_safe_filename, copy_file
+)
+
+
+class TestCsvHelpers:
+    """Tests for CSV read/write helpers"""
+
+    def test_read_csv_missing_file(self, tmp_path):
+        """Test that a missing file returns no rows"""
+        assert read_csv(str(tmp_path / "missing.csv")) == []
+        assert list(iter_csv(str(tmp_path / "missing.csv"))) == []
+
+    def test_write_then_read_roundtrip(self, tmp_path):
+        """Test that written rows are read back, BOM stripped"""
+        path = str(tmp_path / "out" / "data.csv")
+        assert write_csv(path, [["1", "Máy A"], ["2", "Máy B"]], headers=["id", "name"])
+
+        assert read_csv(path) == [["id", "name"], ["1", "Máy A"], ["2", "Máy B"]]
+
+    def test_iter_csv_is_lazy(self, tmp_path):
+        """Test that iter_csv yields rows one by one"""
+        path = tmp_path / "data.csv"
+        path.write_text("a,b\nc,d\n", encoding="utf-8")
+
+        rows = iter_csv(str(path))
+        assert next(rows) == ["a", "b"]
+        assert next(rows) == ["c", "d"]
+        with pytest.raises(StopIteration):
+            next(rows)
+
+
+class TestSafeFilename:
+    """Tests for get_safe_filename"""
+
+    def test_replaces_invalid_characters(self):
+        """Test that every invalid character becomes an underscore"""
+        assert get_safe_filename('a<b>c:d"e/f\\g|h?i*j.txt') == "a_b_c_d_e_f_g_h_i_j.txt"
+
+    def test_keeps_valid_name(self):
+        """Test that valid names are unchanged"""
+        assert get_safe_filename("Báo cáo 2024.csv") == "Báo cáo 2024.csv"
+
+
+class TestCopyFile:
+    """Tests for copy_file"""
+
+    def test_copy_to_new_directory(self, tmp_path):
+        """Test that the file keeps its name when there is no collision"""
+        src = tmp_path / "log.txt"
+        src.write_text("data")
+
+        dest = copy_file(str(src), str(tmp_path / "out"))
+        assert dest == str(tmp_path / "out" / "log.txt")
+        assert (tmp_path / "out" / "log.txt").read_text() == "data"
+
+    def test_duplicate_names_get_next_counter(self, tmp_path):
+        """Test that collisions pick the first free suffix"""
+        src = tmp_path / "log.txt"
+        src.write_text("new")
+        out = tmp_path / "out"
+        out.mkdir()
+        for name in ("log.txt", "log_1.txt", "log_2.txt"):
+            (out / name).write_text("old")
+
+        dest = copy_file(str(src), str(out))
+        assert dest == str(out / "log_3.txt")
+        assert (out / "log_3.txt").read_text() == "new"
+
+    def test_missing_source_returns_none(self, tmp_path):
+        """Test that a missing source is rejected"""
+        assert copy_file(str(tmp_path / "missing.txt"), str(tmp_path)) is None
+
+    def test_unusable_destination_returns_none(self, tmp_path):
+        """Test that a destination that cannot be listed returns None instead of raising"""
+        src = tmp_path / "log.txt"
+        src.write_text("data")
+        blocker = tmp_path / "file_not_dir"
+        blocker.write_text("x")
+
+        assert copy_file(str(src), str(blocker)) is None
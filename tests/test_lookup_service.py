@@ -200,3 +200,54 @@ class TestEquipmentCaching:
         assert self.service._equipment_cache is None
         assert self.service._get_from_cache("equipment_list") is None
 
+    @patch('src.services.lookup_service.get_db')
+    def test_get_equipment_by_id_uses_single_query(self, mock_get_db):
+        """Test that per-id lookups are served from one full equipment load"""
+        mock_db = Mock()
+        mock_db.fetch_all.return_value = [
+            ("F1", "EQ001", "Oven", "", "R1", "R2", "", "", "", ""),
+            ("F1", "EQ002", "Chamber", "", "", "", "", "", "", ""),
+        ]
+        mock_get_db.return_value = mock_db
+
+        assert self.service.get_equipment_name("EQ001") == "Oven"
+        assert self.service.get_equipment_recipes("EQ001") == ["R1", "R2"]
+        assert self.service.get_equipment_name("EQ002") == "Chamber"
+        assert self.service.get_equipment_by_id("EQ999") is None
+        assert mock_db.fetch_all.call_count == 1
+        mock_db.fetch_one.assert_not_called()
+
+    @patch('src.services.lookup_service.get_db')
+    def test_get_equipment_by_id_ignores_case(self, mock_get_db):
+        """Test that lookups match control_no case-insensitively and skip empty ids"""
+        mock_db = Mock()
+        mock_db.fetch_all.return_value = [
+            ("F1", "Eq-001 ", "Oven", "", "", "", "", "", "", ""),
+            ("F1", None, "Unknown", "", "", "", "", "", "", ""),
+        ]
+        mock_get_db.return_value = mock_db
+
+        assert self.service.get_equipment_name("EQ-001") == "Oven"
+        assert self.service.get_equipment_name(" eq-001") == "Oven"
+        assert self.service.get_equipment_by_id("") is None
+        assert "" not in self.service._equipment_index
+
+    @patch('src.services.lookup_service.get_db')
+    def test_equipment_changed_event_invalidates(self, mock_get_db):
+        """Test that the singleton drops equipment caches on equipment_changed"""
+        import src.services.lookup_service as module
+        from src.services.data_event_bus import get_event_bus
+
+        mock_db = Mock()
+        mock_db.fetch_all.return_value = [("EQ001",)]
+        mock_get_db.return_value = mock_db
+
+        with patch.object(module, "_lookup_service", None):
+            service = module.get_lookup_service()
+            service.get_equipment_list()
+            get_event_bus().equipment_changed.emit()
+            service.get_equipment_list()
+            get_event_bus().equipment_changed.disconnect(service.invalidate_equipment_cache)
+            get_event_bus().lookup_changed.disconnect(service.invalidate_cache)
+
+        assert mock_db.fetch_all.call_count == 2
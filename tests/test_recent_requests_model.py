@@ -0,0 +1,62 @@
+"""
+Unit tests for Recent Requests Model
+Tests for the Input tab table model
+"""
+import pytest
+from PyQt6.QtCore import Qt
+
+from src.views.input_tab.table_section import (
+    RecentRequestsModel, RESULT_TEXT_COLORS
+)
+
+
+@pytest.fixture
+def model():
+    """Model with STT + 3 data columns and two rows"""
+    m = RecentRequestsModel(["STT", "Mã YC", "Số lượng", "KQ Cuối"])
+    m.set_rows([("R1", 5, "Pass"), ("R2", None, "")])
+    return m
+
+
+class TestRecentRequestsModel:
+    """Tests for RecentRequestsModel"""
+
+    def test_shape_and_values(self, model):
+        """Test row/column counts, STT column and text conversion"""
+        assert model.rowCount() == 2
+        assert model.columnCount() == 4
+        assert model.value(0, 0) == "1"
+        assert model.value(1, 0) == "2"
+        assert model.data(model.index(0, 2)) == "5"
+        assert model.data(model.index(1, 2)) == ""
+
+    def test_result_color_and_alignment(self, model):
+        """Test KQ Cuối foreground and centered STT"""
+        assert model.data(model.index(0, 3), Qt.ItemDataRole.ForegroundRole) == RESULT_TEXT_COLORS["Pass"]
+        assert model.data(model.index(1, 3), Qt.ItemDataRole.ForegroundRole) is None
+        assert model.data(model.index(0, 0), Qt.ItemDataRole.TextAlignmentRole) == Qt.AlignmentFlag.AlignCenter
+
+    def test_set_rows_resets(self, model):
+        """Test that set_rows replaces all rows with one model reset"""
+        resets = []
+        model.modelReset.connect(lambda: resets.append(True))
+        model.set_rows([("R3", 1, "Fail")])
+        assert resets == [True]
+        assert model.rowCount() == 1
+        assert model.value(0, 1) == "R3"
+
+    def test_append_rows_pages(self):
+        """Test that fetchMore calls the page callback and append_rows adds rows"""
+        calls = []
+        m = RecentRequestsModel(["STT", "Mã YC"], fetch_more=lambda: calls.append(True))
+        m.set_rows([("R1",), ("R2",)], has_more=True)
+        assert m.has_more
+        assert m.canFetchMore()
+        m.fetchMore()
+        assert calls == [True]
+        assert not m.canFetchMore()  # no second fetch while the page is pending
+        m.append_rows([("R3",)], has_more=False)
+        assert m.rowCount() == 3
+        assert m.value(2, 0) == "3"
+        assert m.raw_row(2) == ("R3",)
+        assert not m.canFetchMore()
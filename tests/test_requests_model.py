@@ -0,0 +1,210 @@
+"""
+Unit tests for Requests Table Model
+Tests for the Edit tab table model
+"""
+import pytest
+from PyQt6.QtCore import Qt
+
+from src.views.edit_tab.requests_model import (
+    RequestsTableModel, clean_rows, LEMON_BRUSH, WHITE_BRUSH, STATUS_BRUSHES, RESULT_BRUSHES
+)
+
+
+@pytest.fixture
+def model():
+    """Model with two rows: status, id, result"""
+    m = RequestsTableModel(["Status", "ID", "Result"], status_col=0,
+                           result_cols=[2], readonly_cols=[1])
+    m.set_rows([("Done", 1, " Pass "), (None, 2, "nan")])
+    return m
+
+
+class TestCleanRows:
+    """Tests for clean_rows"""
+
+    def test_missing_values_become_empty(self):
+        """Test that None and 'nan'/'None' strings become empty strings"""
+        rows = [(None, 1.5), ("nan", None), (" x ", "None")]
+        assert clean_rows(rows) == [["", "1.5"], ["", ""], ["x", ""]]
+
+    def test_no_rows(self):
+        """Test that an empty result gives no rows"""
+        assert clean_rows([]) == []
+
+
+class TestRequestsTableModel:
+    """Tests for RequestsTableModel"""
+
+    def test_shape_and_values(self, model):
+        """Test row/column counts and display text"""
+        assert model.rowCount() == 2
+        assert model.columnCount() == 3
+        assert model.data(model.index(0, 1)) == "1"
+        assert model.data(model.index(0, 2)) == "Pass"
+        assert model.headerData(2, Qt.Orientation.Horizontal) == "Result"
+
+    def test_colors(self, model):
+        """Test background and foreground roles"""
+        bg = Qt.ItemDataRole.BackgroundRole
+        fg = Qt.ItemDataRole.ForegroundRole
+        assert model.data(model.index(0, 0), bg) == WHITE_BRUSH
+        assert model.data(model.index(1, 0), bg) == LEMON_BRUSH
+        assert model.data(model.index(0, 0), fg) == STATUS_BRUSHES["Done"]
+        assert model.data(model.index(0, 2), fg) == RESULT_BRUSHES["Pass"]
+        assert model.data(model.index(0, 1), fg) is None
+
+    def test_brushes_are_shared(self):
+        """Test that statuses with the same color share one QBrush"""
+        assert STATUS_BRUSHES["Done"] is STATUS_BRUSHES["Finish"]
+        assert STATUS_BRUSHES["Done"] is RESULT_BRUSHES["Pass"]
+
+    def test_readonly_column(self, model):
+        """Test that read-only columns are not editable"""
+        assert not model.flags(model.index(0, 1)) & Qt.ItemFlag.ItemIsEditable
+        assert model.flags(model.index(0, 0)) & Qt.ItemFlag.ItemIsEditable
+
+    def test_set_data_marks_row_dirty(self, model):
+        """Test that edits are stored and tracked"""
+        changed = []
+        roles_seen = []
+
+        def on_changed(tl, br, roles=()):
+            changed.append(tl.row())
+            roles_seen.append(list(roles))
+
+        model.dataChanged.connect(on_changed)
+
+        assert model.setData(model.index(1, 0), "Ongoing")
+        assert model.value(1, 0) == "Ongoing"
+        assert model.dirty_rows == {1}
+        assert changed == [1]
+        assert Qt.ItemDataRole.BackgroundRole in roles_seen[0]
+        assert model.data(model.index(1, 0), Qt.ItemDataRole.BackgroundRole) == WHITE_BRUSH
+        assert model.data(model.index(1, 0), Qt.ItemDataRole.ForegroundRole) == STATUS_BRUSHES["Ongoing"]
+
+    def test_set_same_value_is_noop(self, model):
+        """Test that unchanged values do not mark the row dirty"""
+        model.setData(model.index(0, 0), "Done")
+        assert model.dirty_rows == set()
+
+    def test_reload_clears_dirty_rows(self, model):
+        """Test that new rows reset tracking"""
+        model.setData(model.index(0, 0), "Stop")
+        model.set_rows([("Wait", 3, "-")])
+        assert model.dirty_rows == set()
+        assert model.rowCount() == 1
+
+    def test_empty_result_set(self, model):
+        """Test that a filter returning no rows gives an empty model"""
+        model.set_rows([])
+        assert model.rowCount() == 0
+
+    def test_autofill_emits_single_change(self):
+        """Test that a dependent column is filled within one dataChanged"""
+        m = RequestsTableModel(["Equip", "Name"], status_col=-1,
+                               autofill={0: (1, {"EQ1": "Oven"}.get)})
+        m.set_rows([("", "")])
+        changes = []
+        m.dataChanged.connect(lambda tl, br, roles=(): changes.append((tl.column(), br.column())))
+
+        m.setData(m.index(0, 0), "EQ1")
+        assert m.value(0, 1) == "Oven"
+        assert changes == [(0, 1)]
+
+        m.setData(m.index(0, 0), "EQ9")
+        assert m.value(0, 1) == "Oven"
+        assert changes[-1] == (0, 0)
+
+    def test_remove_rows_keeps_state_aligned(self):
+        """Test that removing rows shifts cached colors and dirty rows"""
+        m = RequestsTableModel(["Status", "ID"], status_col=0)
+        m.set_rows([("Done", 1), ("", 2), ("Stop", 3), ("Wait", 4)])
+        m.setData(m.index(3, 1), "40")
+
+        m.remove_rows([0, 1])
+
+        assert m.rowCount() == 2
+        assert m.value(0, 0) == "Stop"
+        assert m.data(m.index(1, 0), Qt.ItemDataRole.ForegroundRole) == STATUS_BRUSHES["Wait"]
+        assert m.data(m.index(0, 0), Qt.ItemDataRole.BackgroundRole) == WHITE_BRUSH
+        assert m.dirty_rows == {1}
+
+    def test_replace_row_repaints_one_row(self, model):
+        """Test that replacing a row updates colors and emits one dataChanged"""
+        changes = []
+        model.dataChanged.connect(lambda a, b: changes.append((a.row(), b.row(), b.column())))
+
+        model.replace_row(1, ("Stop", 2, "Fail"))
+
+        assert model.find_row(2, "Fail") == 1
+        assert model.data(model.index(1, 0), Qt.ItemDataRole.ForegroundRole) == STATUS_BRUSHES["Stop"]
+        assert model.data(model.index(1, 0), Qt.ItemDataRole.BackgroundRole) == WHITE_BRUSH
+        assert changes == [(1, 1, 2)]
+
+    def test_insert_row_shifts_state(self, model):
+        """Test that inserting at the top shifts cached colors and dirty rows"""
+        model.setData(model.index(1, 0), "Wait")
+
+        model.insert_row(0, ("Done", 3, None))
+
+        assert model.rowCount() == 3
+        assert model.find_row(1, "3") == 0
+        assert model.find_row(1, "99") == -1
+        assert model.data(model.index(0, 2), Qt.ItemDataRole.BackgroundRole) == LEMON_BRUSH
+        assert model.data(model.index(2, 0), Qt.ItemDataRole.ForegroundRole) == STATUS_BRUSHES["Wait"]
+        assert model.dirty_rows == {2}
+
+    def test_append_rows_pages(self):
+        """Test that fetchMore asks for one page at a time and append_rows extends state"""
+        requests = []
+        m = RequestsTableModel(["Status", "ID"], status_col=0,
+                               fetch_more=lambda: requests.append(1))
+        m.set_rows([("Done", 2)], has_more=True)
+
+        assert m.canFetchMore()
+        m.fetchMore()
+        m.fetchMore()  # still waiting for the first page
+        assert requests == [1]
+
+        m.append_rows([("", 1)], has_more=False)
+
+        assert m.rowCount() == 2
+        assert not m.canFetchMore()
+        assert m.data(m.index(1, 0), Qt.ItemDataRole.BackgroundRole) == LEMON_BRUSH
+        assert m.data(m.index(1, 0), Qt.ItemDataRole.ForegroundRole) is not None
+
+    def test_remove_all_rows_keeps_paging(self):
+        """Test that removing every loaded row still lets the view ask for more"""
+        requests = []
+        m = RequestsTableModel(["Status", "ID"], status_col=0,
+                               fetch_more=lambda: requests.append(1))
+        m.set_rows([("Done", 2), ("Wait", 1)], has_more=True)
+        m.dirty_rows.add(1)
+
+        m.remove_rows([0, 1])
+
+        assert m.rowCount() == 0
+        assert m.dirty_rows == set()
+        assert m.has_more
+        assert m.canFetchMore()
+        m.fetchMore()
+        assert requests == [1]
+
+    def test_no_paging_during_reload(self):
+        """Test that a pending reload blocks fetchMore until its rows are set"""
+        requests = []
+        m = RequestsTableModel(["Status", "ID"], status_col=0,
+                               fetch_more=lambda: requests.append(1))
+        m.set_rows([("Done", 2)], has_more=True)
+
+        m.begin_reload()
+        assert not m.canFetchMore()
+        m.fetchMore()
+        assert requests == []
+
+        m.set_rows([("Wait", 5)], has_more=True)
+        assert m.canFetchMore()
+
+        m.begin_reload()
+        m.cancel_reload()
+        assert m.canFetchMore()
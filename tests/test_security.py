@@ -149,3 +149,45 @@ class TestConvenienceFunctions:
         """Test safe_filename() convenience function"""
         assert safe_filename("../file.txt") == "file.txt"
 
+
+class TestCompileScanner:
+    """Tests for regex scanner compilation"""
+
+    def test_falls_back_to_re_without_re2(self):
+        """Test that the standard re module is used when re2 is missing"""
+        import re
+        from unittest.mock import patch
+        from src.utils import security
+
+        with patch.object(security, "re2", None):
+            scanner = security._compile_scanner([r"\bDROP\b", r"--"])
+        assert isinstance(scanner, re.Pattern)
+        assert scanner.search("drop table x")
+        assert not scanner.search("dropped")
+
+
+class TestSanitizeFilenameControlChars:
+    """Tests for control character stripping in sanitize_filename"""
+
+    def test_removes_control_characters(self):
+        """Test that control characters are removed"""
+        assert InputSanitizer.sanitize_filename("re\x00port\x1f\t.txt") == "report.txt"
+
+    def test_keeps_unicode_characters(self):
+        """Test that multibyte UTF-8 characters survive byte-level stripping"""
+        assert InputSanitizer.sanitize_filename("Báo cáo/tháng:12?.txt") == "Báo cáotháng12.txt"
+
+
+class TestSanitizeForLog:
+    """Tests for sanitize_for_log masking"""
+
+    def test_masks_mixed_case_keys(self):
+        """Test that keys are matched case-insensitively"""
+        result = InputSanitizer.sanitize_for_log("user=a Token: abc123 PWD=xyz")
+        assert "abc123" not in result
+        assert "xyz" not in result
+        assert result.startswith("user=a ")
+
+    def test_plain_text_unchanged(self):
+        """Test that text without sensitive keys passes through"""
+        assert InputSanitizer.sanitize_for_log("Saved 3 records") == "Saved 3 records"
@@ -0,0 +1,80 @@
+"""
+Unit tests for Application Styles
+Tests for QSS minification and application stylesheet
+"""
+import pytest
+
+from src.styles import _minify, APP_QSS, BTN_STYLE_BLUE, TABLE_STYLE
+
+
+class TestMinify:
+    """Tests for _minify helper"""
+
+    def test_minify_collapses_whitespace(self):
+        """Test that indentation and newlines are removed"""
+        qss = """
+            QPushButton {
+                color: #1565C0;
+                padding: 8px 16px;
+            }
+        """
+        assert _minify(qss) == "QPushButton{color:#1565C0;padding:8px 16px;}"
+
+    def test_minify_strips_comments(self):
+        """Test that comments are removed"""
+        assert _minify("QLabel { /* note */ color: red; }") == "QLabel{color:red;}"
+
+    def test_minify_keeps_descendant_selectors(self):
+        """Test that whitespace between selectors is preserved"""
+        qss = "QComboBox QAbstractItemView::item { padding: 4px; }"
+        assert _minify(qss) == "QComboBox QAbstractItemView::item{padding:4px;}"
+
+    def test_minify_keeps_gradient_arguments(self):
+        """Test that function arguments survive minification"""
+        qss = "QFrame { background: qlineargradient(x1:0, y1:0, stop:0 #FFFFFF, stop:1 #F0F7FF); }"
+        assert _minify(qss) == (
+            "QFrame{background:qlineargradient(x1:0,y1:0,stop:0 #FFFFFF,stop:1 #F0F7FF);}"
+        )
+
+    def test_module_styles_are_minified(self):
+        """Test that module-level styles contain no newlines"""
+        assert "\n" not in BTN_STYLE_BLUE
+        assert "\n" not in TABLE_STYLE
+
+
+class TestAppStyle:
+    """Tests for application-wide stylesheet"""
+
+    @pytest.mark.parametrize("name", [
+        "BtnBlue", "BtnRed", "BtnGreen", "BtnGreenSolid", "BtnOrange", "BtnOrangeSolid"
+    ])
+    def test_app_qss_contains_button_variants(self, name):
+        """Test that every button variant is scoped by objectName"""
+        assert f"QPushButton#{name}{{" in APP_QSS
+        assert f"QPushButton#{name}:hover{{" in APP_QSS
+
+    def test_app_qss_has_no_unscoped_button_rule(self):
+        """Test that APP_QSS does not style every QPushButton"""
+        assert "QPushButton{" not in APP_QSS
+        assert "QPushButton:" not in APP_QSS
+
+
+class TestStyleButton:
+    """Tests for style_button helper"""
+
+    def test_sets_object_name(self):
+        """Test that the variant is applied via objectName"""
+        from unittest.mock import Mock
+        from src.styles import style_button
+
+        btn = Mock()
+        style_button(btn, "GreenSolid")
+        btn.setObjectName.assert_called_once_with("BtnGreenSolid")
+
+    def test_unknown_variant_raises(self):
+        """Test that unknown variants are rejected"""
+        from unittest.mock import Mock
+        from src.styles import style_button
+
+        with pytest.raises(ValueError):
+            style_button(Mock(), "Purple")